@@ -0,0 +1 @@
+"""Standalone performance benchmarks and guards (run with python -m benchmarks.<name>)."""
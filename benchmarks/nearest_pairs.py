@@ -0,0 +1,100 @@
+"""nearest_pairs versus the full sorted distance table (2025 day 8 style).
+
+Produces point pairs in order of increasing distance, once for the first
+--limit pairs (part a) and once until a union-find consumer has connected
+every point (part b), and reports time and peak traced memory of both.
+
+    uv run python -m benchmarks.nearest_pairs
+    uv run python -m benchmarks.nearest_pairs --points 3000 --repeat 1
+"""
+
+import itertools
+import math
+import random
+import time
+from typing import Callable, Iterator, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from core.benchmark import measure_peak_memory
+from utils.display import format_bytes, format_duration
+from utils.spatial import nearest_pairs
+from utils.union_find import UnionFind
+
+console = Console()
+
+Points = list[tuple[int, int, int]]
+
+
+def table_pairs(points: Points, k: Optional[int] = None) -> Iterator[tuple[int, int]]:
+    """All pairs with math.sqrt distances in a dict, sorted up front (the old approach)."""
+    distances = {}
+    for a in range(len(points)):
+        for b in range(a + 1, len(points)):
+            distances[(a, b)] = math.sqrt(sum((p - q) ** 2 for p, q in zip(points[a], points[b])))
+    return iter(sorted(distances, key=distances.__getitem__)[:k])
+
+
+def first_pairs(pairs: Callable, points: Points, limit: int) -> list[tuple[int, int]]:
+    return list(itertools.islice(pairs(points, k=limit), limit))
+
+
+def connecting_pair(pairs: Callable, points: Points, limit: int) -> tuple[int, int]:
+    circuits = UnionFind(len(points))
+    for p0, p1 in pairs(points):
+        if circuits.union(p0, p1) and circuits.components == 1:
+            return p0, p1
+    raise ValueError("points never form a single circuit")
+
+
+def best_time(function: Callable, *args, repeat: int):
+    """Run a function repeat times; return (result, fastest run in seconds)."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+
+def main(
+    points: int = typer.Option(1000, "--points", "-n", help="Number of random 3D points", min=2),
+    limit: int = typer.Option(1000, "--limit", help="Pairs to produce for the first-k case", min=1),
+    repeat: int = typer.Option(3, "--repeat", "-r", help="Runs per variant (the best one counts)", min=1),
+    seed: int = typer.Option(2025, "--seed", help="Random seed for the points"),
+):
+    """Compare nearest_pairs against sorting the full distance table."""
+    rng = random.Random(seed)
+    coords = [tuple(rng.randrange(100_000) for _ in range(3)) for _ in range(points)]
+
+    table = Table(title=f"Closest pairs, {points} points (best of {repeat})")
+    table.add_column("Case", style="cyan")
+    table.add_column("Sorted table", justify="right")
+    table.add_column("nearest_pairs", justify="right")
+    table.add_column("Speedup", justify="right", style="green")
+    table.add_column("Peak memory", justify="right")
+
+    cases = [(f"first {limit} pairs", first_pairs), ("until connected", connecting_pair)]
+    for name, case in cases:
+        expected, baseline_time = best_time(case, table_pairs, coords, limit, repeat=repeat)
+        result, candidate_time = best_time(case, nearest_pairs, coords, limit, repeat=repeat)
+        if result != expected:
+            console.print(f"[red]❌ {name}: nearest_pairs disagrees with the sorted table[/red]")
+            raise typer.Exit(code=1)
+        baseline_memory = measure_peak_memory(lambda _: case(table_pairs, coords, limit), "")
+        candidate_memory = measure_peak_memory(lambda _: case(nearest_pairs, coords, limit), "")
+        table.add_row(
+            name,
+            format_duration(baseline_time),
+            format_duration(candidate_time),
+            f"{baseline_time / candidate_time:.1f}x",
+            f"{format_bytes(baseline_memory)} → {format_bytes(candidate_memory)}",
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,83 @@
+"""Arithmetic repeated-digit sums versus per-id string checks (2025 day 2 style).
+
+Sums the ids in ranges of growing width that are a digit block repeated
+exactly twice (part a) or at least twice (part b), once by checking every
+id as a string like the original solution did, and once with
+utils.digits.sum_repeated. Brute force grows with the width of the range,
+the arithmetic version only with the number of digits.
+
+    uv run python -m benchmarks.repeated_digits
+    uv run python -m benchmarks.repeated_digits --max-width 7 --repeat 1
+"""
+
+import time
+from typing import Callable, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from utils.digits import sum_repeated
+from utils.display import format_duration
+
+console = Console()
+
+
+def brute_force(lo: int, hi: int, repeats: Optional[int] = None) -> int:
+    """The original approach: stringify every id in the range."""
+    total = 0
+    for n in range(lo, hi + 1):
+        s = str(n)
+        if repeats is None:
+            if s in (s + s)[1:-1]:
+                total += n
+        elif len(s) % repeats == 0 and s == s[:len(s) // repeats] * repeats:
+            total += n
+    return total
+
+
+def best_time(function: Callable, *args, repeat: int):
+    """Run a function repeat times; return (result, fastest run in seconds)."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+
+def main(
+    max_width: int = typer.Option(6, "--max-width", help="Widest range to test, as a power of ten", min=1, max=8),
+    repeat: int = typer.Option(3, "--repeat", "-r", help="Runs per variant (the best one counts)", min=1),
+):
+    """Compare sum_repeated against brute force on ranges of width 10..10^max_width."""
+    table = Table(title=f"Repeated-digit id sums (best of {repeat})")
+    table.add_column("Range", style="cyan")
+    table.add_column("Part", justify="center")
+    table.add_column("Brute force", justify="right")
+    table.add_column("sum_repeated", justify="right")
+    table.add_column("Speedup", justify="right", style="green")
+
+    for width in range(1, max_width + 1):
+        # Start mid-way through a digit length so ranges cross into the next one
+        lo = 5 * 10 ** (width - 1)
+        hi = lo + 10**width
+        for part, repeats in (("a", 2), ("b", None)):
+            expected, baseline_time = best_time(brute_force, lo, hi, repeats, repeat=repeat)
+            result, candidate_time = best_time(sum_repeated, lo, hi, repeats, repeat=repeat)
+            if result != expected:
+                console.print(f"[red]❌ {lo}-{hi} part {part}: sum_repeated gave {result}, brute force {expected}[/red]")
+                raise typer.Exit(code=1)
+            table.add_row(
+                f"{lo}-{hi}",
+                part,
+                format_duration(baseline_time),
+                format_duration(candidate_time),
+                f"{baseline_time / candidate_time:,.0f}x",
+            )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    typer.run(main)
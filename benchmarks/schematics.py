@@ -0,0 +1,100 @@
+"""Regex schematic parser versus the eval-based parser (2025 day 10 style).
+
+Generates random machine schematic lines and parses them once with the
+original split-and-eval parse_line and once with
+utils.schematics.parse_schematic, checking that both agree and reporting
+the cost per line.
+
+    uv run python -m benchmarks.schematics
+    uv run python -m benchmarks.schematics --lines 20000 --repeat 5
+"""
+
+import random
+import time
+from typing import Callable
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from utils.display import format_duration
+from utils.schematics import parse_schematic
+
+console = Console()
+
+
+def eval_parse_line(line: str):
+    """The original 2025 day 10 parser: eval every button tuple and the joltage list."""
+    indicators, rem = line.split("] ")
+    indicators = indicators.replace("[", "")
+    indicators = [i == "#" for i in indicators]
+    wiring_schematics, rem = rem.split(" {")
+    wiring_schematics = list(map(eval, wiring_schematics.split(" ")))
+    joltages = eval("[" + rem.replace("}", "]"))
+    return indicators, wiring_schematics, joltages
+
+
+def random_line(rng: random.Random) -> str:
+    """A schematic line shaped like the puzzle input: up to 10 lights and 13 buttons."""
+    size = rng.randint(4, 10)
+    indicators = "".join(rng.choice(".#") for _ in range(size))
+    buttons = [sorted(rng.sample(range(size), rng.randint(1, size))) for _ in range(rng.randint(3, 13))]
+    joltages = [rng.randint(0, 300) for _ in range(size)]
+    wiring = " ".join("(" + ",".join(map(str, button)) + ")" for button in buttons)
+    return f"[{indicators}] {wiring} {{{','.join(map(str, joltages))}}}"
+
+
+def same_result(line: str) -> bool:
+    """Whether both parsers read the same lights, buttons and joltages from a line."""
+    indicators, wiring_schematics, joltages = eval_parse_line(line)
+    schematic = parse_schematic(line)
+    buttons = [(w,) if isinstance(w, int) else w for w in wiring_schematics]
+    lights = sum(1 << i for i, on in enumerate(indicators) if on)
+    return (lights, buttons, joltages) == (schematic.lights, list(schematic.buttons), list(schematic.joltages))
+
+
+def best_time(function: Callable, lines: list[str], repeat: int) -> float:
+    """Fastest of repeat runs parsing every line, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line in lines:
+            function(line)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(
+    lines: int = typer.Option(5000, "--lines", "-n", help="Number of random schematic lines", min=1),
+    repeat: int = typer.Option(3, "--repeat", "-r", help="Runs per variant (the best one counts)", min=1),
+    seed: int = typer.Option(2025, "--seed", help="Random seed for the lines"),
+):
+    """Compare parse_schematic against the eval-based parser on random lines."""
+    rng = random.Random(seed)
+    text = [random_line(rng) for _ in range(lines)]
+    for line in text:
+        if not same_result(line):
+            console.print(f"[red]❌ Parsers disagree on {line!r}[/red]")
+            raise typer.Exit(code=1)
+
+    table = Table(title=f"Schematic parsing, {lines} lines (best of {repeat})")
+    table.add_column("Parser", style="cyan")
+    table.add_column("Total", justify="right")
+    table.add_column("Per line", justify="right")
+    table.add_column("Speedup", justify="right", style="green")
+
+    baseline_time = best_time(eval_parse_line, text, repeat)
+    candidate_time = best_time(parse_schematic, text, repeat)
+    table.add_row("eval", format_duration(baseline_time), format_duration(baseline_time / lines), "1.0x")
+    table.add_row(
+        "parse_schematic",
+        format_duration(candidate_time),
+        format_duration(candidate_time / lines),
+        f"{baseline_time / candidate_time:.1f}x",
+    )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,130 @@
+"""CLI startup-time guard based on python -X importtime.
+
+Runs main.py for cheap invocations (help screens) several times and checks
+that the median total import time stays under a budget and that heavy
+dependencies are not imported. The median ignores the odd slow run on a
+busy machine, and the default budget leaves room above the ~200-300ms a
+typical run takes. It also checks that the one-line help stored in the
+lazy command registry matches each command's docstring. Exits non-zero
+when a check fails.
+
+    uv run python -m benchmarks.startup
+    uv run python -m benchmarks.startup --budget 400 --repeat 9
+"""
+
+import importlib
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+MAIN = Path(__file__).parent.parent / "main.py"
+
+# Invocations that should stay fast
+INVOCATIONS = [
+    ["--help"],
+    ["new", "--help"],
+    ["solve", "--help"],
+    ["bench", "--help"],
+    ["run-all", "--help"],
+]
+
+# Modules that no help screen may pull in
+FORBIDDEN = ["aocd", "numpy", "pulp", "tqdm"]
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$")
+
+
+def measure(args: list[str]) -> tuple[float, set[str]]:
+    """
+    Run main.py under -X importtime.
+
+    Args:
+        args: Command line arguments for main.py
+
+    Returns:
+        Tuple of (total import time in seconds, names of all imported modules)
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", str(MAIN), *args],
+        capture_output=True,
+        text=True,
+        cwd=MAIN.parent,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"main.py {' '.join(args)} failed:\n{proc.stderr}")
+
+    total_us = 0
+    modules = set()
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative, indent, name = int(match.group(2)), match.group(3), match.group(4)
+        modules.add(name)
+        # Top-level imports carry one space of indentation; their cumulative times add up to the total
+        if len(indent) == 1:
+            total_us += cumulative
+    return total_us / 1e6, modules
+
+
+def stale_help() -> list[str]:
+    """Commands whose registry help in main.LazyGroup differs from the first line of their docstring."""
+    from main import LazyGroup
+
+    stale = []
+    for name, (target, short_help) in LazyGroup.lazy_commands.items():
+        module_name, function_name = target.split(":")
+        function = getattr(importlib.import_module(module_name), function_name)
+        if (function.__doc__ or "").strip().splitlines()[0] != short_help:
+            stale.append(name)
+    return stale
+
+
+def main(
+    budget: float = typer.Option(500.0, "--budget", help="Maximum median import time per invocation, in ms"),
+    repeat: int = typer.Option(7, "--repeat", "-r", help="Runs per invocation (the median counts)", min=1),
+):
+    """Check CLI import time and forbidden heavy imports for cheap invocations."""
+    table = Table(title=f"CLI startup (median of {repeat}, budget {budget:.0f}ms)")
+    table.add_column("Invocation", style="cyan")
+    table.add_column("Median", justify="right")
+    table.add_column("Min-max", justify="right")
+    table.add_column("Forbidden imports")
+
+    failed = False
+    for args in INVOCATIONS:
+        runs = [measure(args) for _ in range(repeat)]
+        totals = [total * 1000 for total, _ in runs]
+        median = statistics.median(totals)
+        imported_roots = {name.split(".")[0] for _, modules in runs for name in modules}
+        forbidden = sorted(imported_roots.intersection(FORBIDDEN))
+        over_budget = median > budget
+        failed |= over_budget or bool(forbidden)
+        table.add_row(
+            " ".join(args),
+            f"[red]{median:.1f}ms[/red]" if over_budget else f"{median:.1f}ms",
+            f"{min(totals):.0f}-{max(totals):.0f}ms",
+            f"[red]{', '.join(forbidden)}[/red]" if forbidden else "[green]none[/green]",
+        )
+
+    console.print(table)
+    stale = stale_help()
+    if stale:
+        console.print(f"[red]❌ Lazy command help out of date for: {', '.join(stale)} (update main.LazyGroup.lazy_commands)[/red]")
+        failed = True
+    if failed:
+        console.print("[red]❌ Startup guard failed[/red]")
+        raise typer.Exit(code=1)
+    console.print("[green]✓ Startup within budget[/green]")
+
+
+if __name__ == "__main__":
+    typer.run(main)
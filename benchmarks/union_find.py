@@ -0,0 +1,123 @@
+"""Union-find versus list-of-sets circuit merging (2025 day 8 style).
+
+Connects random 3D points pair by pair in order of increasing distance,
+once for the first --limit pairs (part a) and once until everything forms
+a single circuit (part b), and times the merging only. Pair generation and
+sorting are shared and excluded from the timings.
+
+    uv run python -m benchmarks.union_find
+    uv run python -m benchmarks.union_find --points 2000 --repeat 5
+"""
+
+import random
+import time
+from typing import Callable
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from utils.display import format_duration
+from utils.union_find import UnionFind
+
+console = Console()
+
+
+def sorted_pairs(points: list[tuple[int, int, int]]) -> list[tuple[int, int]]:
+    """All index pairs, ordered by increasing squared distance."""
+    pairs = [(i, j) for i in range(len(points)) for j in range(i + 1, len(points))]
+
+    def squared_distance(pair: tuple[int, int]) -> int:
+        (x0, y0, z0), (x1, y1, z1) = points[pair[0]], points[pair[1]]
+        return (x1 - x0) ** 2 + (y1 - y0) ** 2 + (z1 - z0) ** 2
+
+    pairs.sort(key=squared_distance)
+    return pairs
+
+
+def _pop_chain(chains: list[set], p: int) -> set:
+    for idx, chain in enumerate(chains):
+        if p in chain:
+            return chains.pop(idx)
+    return {p}
+
+
+def sets_first(n: int, pairs: list[tuple[int, int]]) -> list[int]:
+    """Circuit sizes after connecting the given pairs, the way 2025 day 8 used to."""
+    chains: list[set] = []
+    for p0, p1 in pairs:
+        chains.append(_pop_chain(chains, p0) | _pop_chain(chains, p1))
+    return sorted(map(len, chains), reverse=True)[:3]
+
+
+def sets_until_connected(n: int, pairs: list[tuple[int, int]]) -> tuple[int, int]:
+    """The pair that joins everything into one circuit, using list-of-sets merging."""
+    chains: list[set] = []
+    for p0, p1 in pairs:
+        chains.append(_pop_chain(chains, p0) | _pop_chain(chains, p1))
+        if len(chains) == 1 and len(chains[0]) == n:
+            return p0, p1
+    raise ValueError("points never form a single circuit")
+
+
+def union_find_first(n: int, pairs: list[tuple[int, int]]) -> list[int]:
+    """Circuit sizes after connecting the given pairs, using UnionFind."""
+    circuits = UnionFind(n)
+    for p0, p1 in pairs:
+        circuits.union(p0, p1)
+    return circuits.component_sizes()[:3]
+
+
+def union_find_until_connected(n: int, pairs: list[tuple[int, int]]) -> tuple[int, int]:
+    """The pair that joins everything into one circuit, using UnionFind."""
+    circuits = UnionFind(n)
+    for p0, p1 in pairs:
+        if circuits.union(p0, p1) and circuits.components == 1:
+            return p0, p1
+    raise ValueError("points never form a single circuit")
+
+
+def best_time(function: Callable, *args, repeat: int):
+    """Run a function repeat times; return (result, fastest run in seconds)."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+
+def main(
+    points: int = typer.Option(1000, "--points", "-n", help="Number of random 3D points", min=2),
+    limit: int = typer.Option(1000, "--limit", help="Pairs to connect for the first-k case", min=1),
+    repeat: int = typer.Option(3, "--repeat", "-r", help="Runs per variant (the best one counts)", min=1),
+    seed: int = typer.Option(2025, "--seed", help="Random seed for the points"),
+):
+    """Compare union-find against list-of-sets merging on random points."""
+    rng = random.Random(seed)
+    coords = [tuple(rng.randrange(100_000) for _ in range(3)) for _ in range(points)]
+    pairs = sorted_pairs(coords)
+
+    table = Table(title=f"Circuit merging, {points} points (best of {repeat})")
+    table.add_column("Case", style="cyan")
+    table.add_column("list\\[set]", justify="right")
+    table.add_column("UnionFind", justify="right")
+    table.add_column("Speedup", justify="right", style="green")
+
+    cases = [
+        (f"first {limit} pairs", sets_first, union_find_first, pairs[:limit]),
+        ("until connected", sets_until_connected, union_find_until_connected, pairs),
+    ]
+    for name, baseline, candidate, case_pairs in cases:
+        expected, baseline_time = best_time(baseline, points, case_pairs, repeat=repeat)
+        result, candidate_time = best_time(candidate, points, case_pairs, repeat=repeat)
+        if result != expected:
+            console.print(f"[red]❌ {name}: UnionFind gave {result}, list\\[set] gave {expected}[/red]")
+            raise typer.Exit(code=1)
+        table.add_row(name, format_duration(baseline_time), format_duration(candidate_time), f"{baseline_time / candidate_time:.1f}x")
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    typer.run(main)
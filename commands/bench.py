@@ -0,0 +1,174 @@
+"""Bench command - times every solved puzzle and writes a timing report."""
+
+import csv
+import json
+import platform
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+import typer
+from rich.table import Table
+
+from core.benchmark import benchmark, measure_peak_memory
+from core.history import check_history, make_record
+from core.cache import get_input
+from core.runner import get_part_function
+from core.supervisor import run_supervised
+from utils.display import console, format_bytes, format_duration
+from utils.paths import iter_solution_paths
+
+REPORT_FIELDS = [
+    "year", "day", "part", "status", "answer", "runs", "warmup", "outliers",
+    "min", "median", "mean", "p95", "max", "stddev", "peak_memory", "error",
+]
+REPORT_SUFFIXES = (".json", ".csv")
+
+
+def bench(
+    year: Optional[int] = typer.Option(None, "--year", "-y", help="Only benchmark solutions of this year"),
+    runs: int = typer.Option(5, "--runs", "-n", help="Timed runs per puzzle part", min=1),
+    warmup: int = typer.Option(1, "--warmup", help="Untimed warmup runs per puzzle part", min=0),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Write the report to this .json or .csv file"),
+    offline: bool = typer.Option(False, "--offline", help="Only use cached inputs, never the network"),
+    memory: bool = typer.Option(True, "--memory/--no-memory", help="Measure peak memory with an extra traced run"),
+    save: bool = typer.Option(False, "--save", help="Append this run to the benchmark history"),
+    compare: bool = typer.Option(False, "--compare", help="Compare against the benchmark history and fail on regressions"),
+    baseline: Optional[str] = typer.Option(None, "--baseline", help="Compare against runs of this commit (default: latest run)"),
+    threshold: float = typer.Option(0.1, "--threshold", help="Relative slowdown that counts as a regression (0.1 = 10%)", min=0),
+    timeout: Optional[float] = typer.Option(None, "--timeout", help="Give up on a puzzle part after this many seconds (all runs)", min=0),
+    max_mem: Optional[int] = typer.Option(None, "--max-mem", help="Give up on a puzzle part that uses more than this many MiB", min=1),
+):
+    """
+    Benchmark every solution file on its real input.
+
+    Examples:
+        bench                          - Benchmark all solutions
+        bench -y 2025 -n 10            - 10 timed runs per part for 2025 only
+        bench -o timings.json          - Also write a machine-readable report
+        bench --save                   - Record the run in the benchmark history
+        bench --compare --threshold .2 - Flag parts more than 20% slower than the history
+        bench --timeout 60             - Skip parts that need more than a minute, killing their pools
+    """
+    if output is not None and output.suffix.lower() not in REPORT_SUFFIXES:
+        # Fail before benchmarking anything rather than after the whole run
+        console.print(f"[red]Error: Unsupported report format '{output.suffix}' (use .json or .csv)[/red]")
+        raise typer.Exit(code=1)
+
+    max_memory = None if max_mem is None else max_mem * 2**20
+    records = []
+    for puzzle_year, day, _ in iter_solution_paths(year):
+        try:
+            input_data = get_input(puzzle_year, day, offline=offline)
+        except Exception as e:
+            console.print(f"[red]Error fetching input for Year {puzzle_year}, Day {day}: {e}[/red]")
+            records.extend(_error_record(puzzle_year, day, part, _describe(e)) for part in "ab")
+            continue
+
+        for part in "ab":
+            console.print(f"[cyan]⏱️  Year {puzzle_year}, Day {day}, Part {part.upper()}...[/cyan]")
+            args = (puzzle_year, day, part, input_data, runs, warmup, memory)
+            if timeout is None and max_memory is None:
+                records.append(_bench_part(*args))
+                continue
+
+            # Each part runs in its own supervised process group, killed on a breach
+            result = run_supervised(_bench_part, args, timeout=timeout, max_memory=max_memory)
+            if result.status == "ok":
+                records.append(result.value)
+            else:
+                error = f"{result.error} (killed after {format_duration(result.elapsed)})"
+                records.append(_error_record(puzzle_year, day, part, error, status=result.status))
+
+    if not records:
+        console.print("[yellow]No solution files found[/yellow]")
+        raise typer.Exit(code=1)
+
+    console.print()
+    console.print(_report_table(records))
+
+    if output is not None:
+        write_report(records, output)
+        console.print(f"[green]✓ Wrote report to {output}[/green]")
+
+    check_history(records, save, compare, baseline, threshold)
+
+
+def _bench_part(year: int, day: int, part: str, input_data: str, runs: int, warmup: int, memory: bool) -> dict[str, Any]:
+    """Benchmark one puzzle part, returning a report record (errors are recorded, not raised)."""
+    try:
+        part_function = get_part_function(year, day, part)
+        result = benchmark(part_function, input_data, runs=runs, warmup=warmup)
+        peak_memory = measure_peak_memory(part_function, input_data) if memory else None
+    except (Exception, typer.Exit) as e:
+        return _error_record(year, day, part, _describe(e))
+
+    return make_record(year, day, part, result, peak_memory)
+
+
+def _describe(error: BaseException) -> str:
+    """One-line description of an exception for the report."""
+    return f"{type(error).__name__}: {error}"
+
+
+def _error_record(year: int, day: int, part: str, error: str, status: str = "error") -> dict[str, Any]:
+    """Report record for a puzzle part that could not be benchmarked (status: error, timeout, memory or crashed)."""
+    record: dict[str, Any] = dict.fromkeys(REPORT_FIELDS)
+    record.update(year=year, day=day, part=part, status=status, error=error)
+    return record
+
+
+def _report_table(records: list[dict[str, Any]]) -> Table:
+    """Build the summary table, with the total median runtime in the caption."""
+    table = Table(title="Benchmark Report")
+    table.add_column("Puzzle", style="cyan")
+    table.add_column("Answer", style="green")
+    table.add_column("min", justify="right")
+    table.add_column("median", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("Peak memory", justify="right")
+
+    total = 0.0
+    for record in records:
+        puzzle = f"{record['year']}/{record['day']:02d}{record['part']}"
+        if record["status"] != "ok":
+            table.add_row(puzzle, f"[red]{record['error']}[/red]", "-", "-", "-", "-")
+            continue
+        total += record["median"]
+        table.add_row(
+            puzzle,
+            record["answer"],
+            format_duration(record["min"]),
+            format_duration(record["median"]),
+            format_duration(record["p95"]),
+            format_bytes(record["peak_memory"]) if record["peak_memory"] is not None else "-",
+        )
+
+    table.caption = f"Total median runtime: {format_duration(total)}"
+    return table
+
+
+def write_report(records: list[dict[str, Any]], output: Path) -> None:
+    """
+    Write benchmark records to a JSON or CSV file, chosen by the file suffix.
+
+    Args:
+        records: Report records as produced by the bench command
+        output: Destination path ending in .json or .csv
+    """
+    suffix = output.suffix.lower()
+    if suffix == ".csv":
+        with output.open("w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(records)
+    elif suffix == ".json":
+        report = {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "results": records,
+        }
+        output.write_text(json.dumps(report, indent=2))
+    else:
+        console.print(f"[red]Error: Unsupported report format '{output.suffix}' (use .json or .csv)[/red]")
+        raise typer.Exit(code=1)
@@ -0,0 +1,116 @@
+"""Run-all command - runs many puzzle parts in parallel over a process pool."""
+
+import contextlib
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Optional
+
+import typer
+from rich.table import Table
+
+from core.cache import get_input
+from core.runner import run
+from utils.display import console, format_duration
+from utils.parser import parse_puzzle_selection
+
+
+def run_all(
+    selection: str = typer.Argument(..., help="Puzzles as YYYY/DD[a|b], ranges or globs (e.g., 2025/1-11, 2025/*b)"),
+    workers: Optional[int] = typer.Option(None, "--workers", "-j", help="Worker processes (default: CPU count)", min=1),
+    offline: bool = typer.Option(False, "--offline", help="Only use cached inputs, never the network"),
+):
+    """
+    Run several puzzle parts on their real input in parallel.
+
+    Examples:
+        run-all 2025/*                 - Run every solved 2025 part
+        run-all 2025/1-11b             - Run part B of days 1 to 11
+        run-all 2024/*,2025/3a -j 4    - Combine selections, 4 worker processes
+    """
+    targets = parse_puzzle_selection(selection)
+
+    # Load inputs up front, once per day, so workers never touch the cache or aocd
+    inputs: dict[tuple[int, int], Optional[str]] = {}
+    results: dict[tuple[int, int, str], dict[str, Any]] = {}
+    for year, day, part in targets:
+        if (year, day) in inputs:
+            continue
+        try:
+            inputs[(year, day)] = get_input(year, day, offline=offline)
+        except Exception as e:
+            console.print(f"[red]Error fetching input for Year {year}, Day {day}: {e}[/red]")
+            inputs[(year, day)] = None
+    for year, day, part in targets:
+        if inputs[(year, day)] is None:
+            results[(year, day, part)] = {"status": "error", "answer": None, "elapsed": None, "error": "input unavailable"}
+
+    pending = [target for target in targets if target not in results]
+    workers = min(workers or os.process_cpu_count() or 1, max(len(pending), 1))
+    console.print(f"[cyan]🚀 Running {len(pending)} puzzle part(s) on {workers} worker(s)...[/cyan]")
+
+    start_time = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_run_part, year, day, part, inputs[(year, day)]): (year, day, part)
+            for year, day, part in pending
+        }
+        for future in as_completed(futures):
+            year, day, part = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. killed or out of memory)
+                result = {"status": "error", "answer": None, "elapsed": None, "error": f"{type(e).__name__}: {e}"}
+            results[(year, day, part)] = result
+            mark = "[green]✓[/green]" if result["status"] == "ok" else "[red]✗[/red]"
+            console.print(f"  {mark} {year}/{day:02d}{part}")
+    wall_time = time.perf_counter() - start_time
+
+    console.print()
+    console.print(_results_table(targets, results, wall_time))
+
+    if any(result["status"] != "ok" for result in results.values()):
+        raise typer.Exit(code=1)
+
+
+def _run_part(year: int, day: int, part: str, input_data: str) -> dict[str, Any]:
+    """Run one puzzle part in a worker process; solution output is discarded."""
+    start_time = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            answer = run(year=year, day=day, part=part, input=input_data)
+    except (Exception, typer.Exit) as e:
+        return {
+            "status": "error",
+            "answer": None,
+            "elapsed": time.perf_counter() - start_time,
+            "error": f"{type(e).__name__}: {e}",
+        }
+    return {"status": "ok", "answer": answer, "elapsed": time.perf_counter() - start_time, "error": None}
+
+
+def _results_table(
+    targets: list[tuple[int, int, str]],
+    results: dict[tuple[int, int, str], dict[str, Any]],
+    wall_time: float,
+) -> Table:
+    """Build the results table in puzzle order, with summed and wall-clock time in the caption."""
+    table = Table(title="Results")
+    table.add_column("Puzzle", style="cyan")
+    table.add_column("Answer", style="green")
+    table.add_column("Time", justify="right")
+
+    total = 0.0
+    for year, day, part in targets:
+        result = results[(year, day, part)]
+        elapsed = format_duration(result["elapsed"]) if result["elapsed"] is not None else "-"
+        if result["status"] == "ok":
+            total += result["elapsed"]
+            table.add_row(f"{year}/{day:02d}{part}", result["answer"], elapsed)
+        else:
+            table.add_row(f"{year}/{day:02d}{part}", f"[red]{result['error']}[/red]", elapsed)
+
+    table.caption = f"Sum of run times: {format_duration(total)} · wall clock: {format_duration(wall_time)}"
+    return table
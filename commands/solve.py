@@ -3,12 +3,30 @@
 import sys
 import time
 import traceback
+from pathlib import Path
+from typing import Any, Callable, Optional
+
 import typer
-from aocd.models import Puzzle
 
 from utils.parser import parse_puzzle
-from utils.display import display_result, console
-from core.runner import run
+from utils.display import (
+    console,
+    display_benchmark,
+    display_memory,
+    display_profile,
+    display_result,
+    display_trace,
+    format_duration,
+)
+from utils.paths import get_solution_path
+from core.runner import run, get_part_function
+from core.benchmark import benchmark
+from core.memory import profile_memory
+from core.profiler import ProfileMode, get_profile_dir, profile_cprofile, profile_sample
+from core.supervisor import Limits, run_supervised
+from core.trace import span, tracer
+from core.cache import CacheMiss, Example, get_accepted_answer, get_examples, get_input, record_accepted_answer
+from core.history import check_history, make_record
 
 
 def solve(
@@ -16,6 +34,20 @@ def solve(
     part: str = typer.Argument(None, help="Part (a or b) - required when using file path"),
     submit_answer: bool = typer.Option(False, "--submit", "-s", help="Submit the answer after solving"),
     skip_examples: bool = typer.Option(False, "--skip-examples", help="Skip running example tests"),
+    offline: bool = typer.Option(False, "--offline", help="Only use cached inputs/examples, never the network"),
+    bench: int = typer.Option(0, "--bench", "-b", help="Benchmark the solution over N timed runs", min=0),
+    warmup: int = typer.Option(1, "--warmup", help="Untimed warmup runs before benchmarking", min=0),
+    save: bool = typer.Option(False, "--save", help="Append the --bench result to the benchmark history"),
+    compare: bool = typer.Option(False, "--compare", help="Compare the --bench result against the benchmark history"),
+    threshold: float = typer.Option(0.1, "--threshold", help="Relative slowdown that counts as a regression (0.1 = 10%)", min=0),
+    mem: bool = typer.Option(False, "--mem", help="Profile peak memory, RSS and the lines holding the most memory"),
+    profile: Optional[ProfileMode] = typer.Option(None, "--profile", "-p", help="Profile the solution with cProfile or a sampling profiler"),
+    profile_top: int = typer.Option(15, "--profile-top", help="Number of hot functions to show with --profile", min=1),
+    watch: bool = typer.Option(False, "--watch", "-w", help="Re-run examples and input whenever the solution file is saved"),
+    timeout: Optional[float] = typer.Option(None, "--timeout", help="Kill the solution after this many seconds", min=0),
+    max_mem: Optional[int] = typer.Option(None, "--max-mem", help="Kill the solution when it uses more than this many MiB", min=1),
+    trace: bool = typer.Option(False, "--trace", help="Show a per-phase latency waterfall"),
+    trace_file: Optional[Path] = typer.Option(None, "--trace-file", help="Write the phases as Chrome trace-event JSON (implies --trace)"),
 ):
     """
     Run an Advent of Code solution for a specific puzzle.
@@ -24,7 +56,15 @@ def solve(
         solve 2024/3a                  - Run year 2024, day 3, part A
         solve 2024/15b -s              - Run and submit year 2024, day 15, part B
         solve solutions/2024/03.py a   - Run from file path (useful for debugging)
+        solve 2025/8a --bench 20       - Benchmark over 20 runs after warmup
+        solve 2025/8a --offline        - Run from the local cache without network access
+        solve 2025/8a --trace          - Show where the wall-clock time goes
+        solve 2025/8a --watch          - Re-run on every save of the solution file
+        solve 2025/8a --mem            - Show peak memory and the lines holding it
+        solve 2025/8a -p sample        - Sample the hot functions, write a flamegraph file
+        solve 2025/9b --timeout 30     - Give up (and kill worker pools) after 30 seconds
     """
+    tracer.add_since("cli", "CLI parse")
     year, day, parsed_part = parse_puzzle(puzzle, require_part=False)
 
     # Use parsed part if available, otherwise use provided part argument
@@ -42,59 +82,279 @@ def solve(
 
     part = part.lower()
 
+    if offline and submit_answer:
+        console.print("[red]Error: --submit needs network access and cannot be combined with --offline[/red]")
+        raise typer.Exit(code=1)
+
+    if sum([bool(bench), mem, profile is not None]) > 1:
+        console.print("[red]Error: --bench, --mem and --profile cannot be combined (they skew each other)[/red]")
+        raise typer.Exit(code=1)
+
+    if (timeout is not None or max_mem is not None) and (mem or profile is not None):
+        console.print("[red]Error: --timeout and --max-mem cannot be combined with --mem or --profile[/red]")
+        raise typer.Exit(code=1)
+    limits = Limits(timeout, None if max_mem is None else max_mem * 2**20)
+
+    if watch:
+        if submit_answer or bench or mem or profile is not None:
+            console.print("[red]Error: --watch cannot be combined with --submit, --bench, --mem or --profile[/red]")
+            raise typer.Exit(code=1)
+        _watch(year, day, part, skip_examples, offline, limits)
+        return
+
+    try:
+        _solve(year, day, part, submit_answer, skip_examples, offline, bench, warmup, save, compare, threshold, mem, profile, profile_top, limits)
+    finally:
+        if trace or trace_file is not None:
+            display_trace(tracer)
+        if trace_file is not None:
+            tracer.write_chrome_trace(trace_file)
+            console.print(f"[green]✓ Wrote Chrome trace to {trace_file}[/green]")
+
+
+def _solve(
+    year: int,
+    day: int,
+    part: str,
+    submit_answer: bool,
+    skip_examples: bool,
+    offline: bool,
+    bench: int,
+    warmup: int,
+    save: bool,
+    compare: bool,
+    threshold: float,
+    mem: bool,
+    profile: Optional[ProfileMode],
+    profile_top: int,
+    limits: Limits,
+) -> None:
+    """Load the puzzle data, check the examples, run (or benchmark) and optionally submit."""
+    input_data, examples = _load_puzzle_data(year, day, skip_examples, offline)
+
+    # Run examples first (if available and not skipped)
+    if not skip_examples:
+        _run_examples(year, day, part, examples, limits)
+
+    if bench:
+        console.print(f"[cyan]⏱️  Benchmarking Year {year}, Day {day}, Part {part.upper()} ({warmup} warmup, {bench} runs)...[/cyan]")
+        part_function = get_part_function(year, day, part)
+        with span(f"benchmark part {part}"):
+            if limits.active:
+                result, _ = _supervised(limits, benchmark, part_function, input_data, bench, warmup)
+            else:
+                result = benchmark(part_function, input_data, runs=bench, warmup=warmup)
+        display_benchmark(result, year, day, part)
+        check_history([make_record(year, day, part, result)], save, compare, None, threshold)
+        answer = result.answer
+    elif mem:
+        console.print(f"[cyan]🧠 Profiling memory for Year {year}, Day {day}, Part {part.upper()}...[/cyan]")
+        part_function = get_part_function(year, day, part)
+        with span(f"memory profile part {part}"):
+            memory_profile = profile_memory(part_function, input_data)
+        display_memory(memory_profile, year, day, part)
+        answer = memory_profile.answer
+    elif profile is not None:
+        console.print(f"[cyan]🔬 Profiling Year {year}, Day {day}, Part {part.upper()} ({profile.value})...[/cyan]")
+        part_function = get_part_function(year, day, part)
+        output = get_profile_dir() / f"{year}_{day:02d}{part}_{profile.value}"
+        profiler = profile_cprofile if profile == ProfileMode.cprofile else profile_sample
+        with span(f"{profile.value} profile part {part}"):
+            result = profiler(part_function, input_data, output, top=profile_top)
+        display_profile(result, year, day, part)
+        answer = result.answer
+    else:
+        answer, _ = _run_timed(year, day, part, input_data, limits)
+
+    # Before submitting, pick up answers accepted on the website as well
+    accepted = get_accepted_answer(year, day, part, fetch=submit_answer)
+    if accepted is not None:
+        if answer == accepted:
+            console.print("[green]✓ Matches the previously accepted answer[/green]")
+        else:
+            console.print(f"[yellow]⚠️  Differs from the previously accepted answer {accepted}[/yellow]")
+
+    # Submit if requested
+    if submit_answer and accepted is not None:
+        console.print(f"[yellow]Part {part.upper()} was already accepted, not submitting again[/yellow]")
+    elif submit_answer:
+        console.print(f"[cyan]📤 Submitting answer for Year {year}, Day {day}, Part {part.lower()}...[/cyan]")
+        try:
+            with span("submission"):
+                # Imported here: aocd is slow to import and only needed to submit
+                from aocd.models import Puzzle
+
+                puzzle = Puzzle(day=day, year=year)
+                if part == "a":
+                    puzzle.answer_a = answer
+                else:
+                    puzzle.answer_b = answer
+                console.print("[green]✓ Answer submitted successfully![/green]")
+                # Remember the answer for offline checks once aocd confirms it was accepted
+                if str(getattr(puzzle, f"answer_{part}", None)) == answer:
+                    record_accepted_answer(year, day, part, answer)
+        except Exception as e:
+            console.print(f"[red]Error submitting answer: {e}[/red]")
+            raise typer.Exit(code=1)
+
+
+def _load_puzzle_data(year: int, day: int, skip_examples: bool, offline: bool) -> tuple[str, list[Example]]:
+    """Load the puzzle input and (unless skipped) the examples."""
     # Get puzzle input
-    console.print(f"[cyan]📥 Fetching input for Year {year}, Day {day}...[/cyan]")
+    console.print(f"[cyan]📥 Loading input for Year {year}, Day {day}...[/cyan]")
     try:
-        puzzle = Puzzle(day=day, year=year)
+        with span("input load"):
+            input_data = get_input(year, day, offline=offline)
     except Exception as e:
         console.print(f"[red]Error fetching input: {e}[/red]")
         raise typer.Exit(code=1)
 
-    # Run examples first (if available and not skipped)
+    examples = []
     if not skip_examples:
-        examples = puzzle.examples
-        if examples:
-            console.print(f"\n[cyan]🧪 Running {len(examples)} example(s) for Part {part.upper()}...[/cyan]")
-            all_passed = True
+        try:
+            with span("examples load"):
+                examples = get_examples(year, day, offline=offline)
+        except CacheMiss as e:
+            console.print(f"[yellow]{e}, skipping examples[/yellow]")
+    return input_data, examples
 
-            for i, example in enumerate(examples, 1):
-                # Get expected answer for this part
-                expected = example.answer_a if part == "a" else example.answer_b
 
-                if expected is None:
-                    console.print(f"[dim]  Example {i}: No expected answer for part {part.upper()}, skipping...[/dim]")
-                    continue
+def _watch(year: int, day: int, part: str, skip_examples: bool, offline: bool, limits: Limits, interval: float = 0.3) -> None:
+    """
+    Re-run the solution every time its file is saved, until interrupted.
 
+    The input, examples and imported libraries stay loaded in this process;
+    only the solution module is re-executed (by the runner's module cache)
+    when its content changes. With limits, every example and run happens in
+    a fresh supervised child instead, so the solution module and whatever it
+    imports are loaded again on each rerun.
+    """
+    input_data, examples = _load_puzzle_data(year, day, skip_examples, offline)
+    solution_path = get_solution_path(year, day)
+    last_elapsed = None
+
+    while True:
+        try:
+            if not skip_examples:
+                _run_examples(year, day, part, examples, limits)
+            _, elapsed = _run_timed(year, day, part, input_data, limits)
+            if last_elapsed is not None:
+                delta = elapsed - last_elapsed
+                style = "green" if delta < 0 else "yellow"
+                console.print(
+                    f"[{style}]⏱️  {format_duration(elapsed)} "
+                    f"({'-' if delta < 0 else '+'}{format_duration(abs(delta))}, {delta / last_elapsed:+.1%} vs last run)[/{style}]"
+                )
+            last_elapsed = elapsed
+        except typer.Exit:
+            pass  # Examples failed or a limit was hit; already reported
+        except Exception:
+            pass  # Solution raised; already reported by _run_timed
+        except KeyboardInterrupt:
+            console.print("\n[dim]Run interrupted[/dim]")
+
+        console.print(f"[dim]👀 Watching {solution_path} for changes (Ctrl+C to stop)...[/dim]")
+        try:
+            mtime = _mtime(solution_path)
+            while True:
+                time.sleep(interval)
+                current = _mtime(solution_path)
+                # A missing file is mid-save (written elsewhere, then renamed over it); wait for it
+                if current is not None and current != mtime:
+                    break
+        except KeyboardInterrupt:
+            console.print("\n[dim]Stopped watching[/dim]")
+            return
+        console.rule(f"[cyan]{solution_path.name} changed[/cyan]")
+
+
+def _mtime(path: Path) -> Optional[int]:
+    """Modification time of a file in ns, or None while it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _run_examples(year: int, day: int, part: str, examples: list[Example], limits: Limits) -> None:
+    """Run the solution on every example with an expected answer (under the limits, if any); exit if any fails."""
+    if examples:
+        console.print(f"\n[cyan]🧪 Running {len(examples)} example(s) for Part {part.upper()}...[/cyan]")
+        all_passed = True
+
+        for i, example in enumerate(examples, 1):
+            # Get expected answer for this part
+            expected = example.answer_a if part == "a" else example.answer_b
+
+            if expected is None:
+                console.print(f"[dim]  Example {i}: No expected answer for part {part.upper()}, skipping...[/dim]")
+                continue
+
+            if limits.active:
+                # Same limits as the real run, so a runaway example cannot hang or exhaust the CLI
+                with span(f"supervised example {i}"):
+                    supervised = run_supervised(
+                        run, (year, day, part, example.input_data), timeout=limits.timeout, max_memory=limits.max_memory
+                    )
+                if supervised.status != "ok":
+                    console.print(f"[red]  ✗ Example {i}: {supervised.status.upper()} - {supervised.error}[/red]")
+                    all_passed = False
+                    continue
+                result = supervised.value
+            else:
                 try:
-                    result = run(year=year, day=day, part=part, input=example.input_data)
-
-                    if str(result) == str(expected):
-                        console.print(f"[green]  ✓ Example {i}: PASSED (got {result})[/green]")
-                    else:
-                        console.print(f"[red]  ✗ Example {i}: FAILED[/red]")
-                        console.print(f"[red]    Expected: {expected}[/red]")
-                        console.print(f"[red]    Got:      {result}[/red]")
-                        all_passed = False
+                    with span(f"example {i}"):
+                        result = run(year=year, day=day, part=part, input=example.input_data)
                 except Exception as e:
                     console.print(f"[red]  ✗ Example {i}: ERROR - {type(e).__name__}: {e}[/red]")
                     console.print(f"[dim]")
                     traceback.print_exc()
                     console.print(f"[/dim]")
                     all_passed = False
+                    continue
 
-            if not all_passed:
-                console.print(f"\n[red]❌ Some examples failed. Fix your solution before running on real input.[/red]")
-                raise typer.Exit(code=1)
+            if str(result) == str(expected):
+                console.print(f"[green]  ✓ Example {i}: PASSED (got {result})[/green]")
+            else:
+                console.print(f"[red]  ✗ Example {i}: FAILED[/red]")
+                console.print(f"[red]    Expected: {expected}[/red]")
+                console.print(f"[red]    Got:      {result}[/red]")
+                all_passed = False
+
+        if not all_passed:
+            console.print(f"\n[red]❌ Some examples failed. Fix your solution before running on real input.[/red]")
+            raise typer.Exit(code=1)
+
+        console.print(f"[green]✓ All examples passed![/green]\n")
+    else:
+        console.print(f"[dim]No examples found for this puzzle[/dim]\n")
 
-            console.print(f"[green]✓ All examples passed![/green]\n")
-        else:
-            console.print(f"[dim]No examples found for this puzzle[/dim]\n")
 
+def _supervised(limits: Limits, target: Callable[..., Any], *args: Any) -> tuple[Any, float]:
+    """Run target(*args) in a supervised subprocess and return (value, elapsed); exit on a breach or error."""
+    result = run_supervised(target, args, timeout=limits.timeout, max_memory=limits.max_memory)
+    if result.status != "ok":
+        title = {"timeout": "Solution timed out", "memory": "Solution hit the memory limit"}.get(result.status, "Error running solution")
+        console.print(f"\n[red]❌ {title} after {format_duration(result.elapsed)} (worker processes killed):[/red]")
+        console.print(f"[red]{result.error}[/red]\n")
+        raise typer.Exit(code=1)
+    return result.value, result.elapsed
+
+
+def _run_timed(year: int, day: int, part: str, input_data: str, limits: Limits) -> tuple[str, float]:
+    """Run the solution once on the real input, display the result and return (answer, elapsed)."""
     # Run the solution with timing
     console.print(f"[cyan]🚀 Running solution for Year {year}, Day {day}, Part {part.upper()}...[/cyan]")
+    if limits.active:
+        with span(f"supervised solution part {part}"):
+            answer, elapsed = _supervised(limits, run, year, day, part, input_data)
+        display_result(answer, year, day, part, elapsed)
+        return answer, elapsed
+
     start_time = time.perf_counter()
     try:
-        answer = run(year=year, day=day, part=part, input=puzzle.input_data)
+        with span(f"solution part {part}"):
+            answer = run(year=year, day=day, part=part, input=input_data)
     except Exception as e:
         elapsed = time.perf_counter() - start_time
         console.print(f"\n[red]❌ Error running solution ({elapsed*1000:.2f}ms):[/red]")
@@ -106,16 +366,4 @@ def solve(
 
     # Display result
     display_result(answer, year, day, part, elapsed)
-
-    # Submit if requested
-    if submit_answer:
-        console.print(f"[cyan]📤 Submitting answer for Year {year}, Day {day}, Part {part.lower()}...[/cyan]")
-        try:
-            if part == "a":
-                puzzle.answer_a = answer
-            else:
-                puzzle.answer_b = answer
-            console.print("[green]✓ Answer submitted successfully![/green]")
-        except Exception as e:
-            console.print(f"[red]Error submitting answer: {e}[/red]")
-            raise typer.Exit(code=1)
+    return answer, elapsed
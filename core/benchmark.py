@@ -0,0 +1,177 @@
+"""Statistical benchmarking of solution part functions."""
+
+import gc
+import math
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing statistics for repeated runs of a part function (all times in seconds)."""
+
+    answer: str
+    samples: list[float]
+    warmup: int
+    outliers: int = 0
+    kept: list[float] = field(default_factory=list)
+
+    @property
+    def runs(self) -> int:
+        return len(self.samples)
+
+    @property
+    def min(self) -> float:
+        return min(self.kept)
+
+    @property
+    def max(self) -> float:
+        return max(self.kept)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.kept)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.kept)
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.kept, 95)
+
+    @property
+    def stddev(self) -> float:
+        return statistics.stdev(self.kept) if len(self.kept) > 1 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary statistics as a plain dict, suitable for JSON/CSV reports."""
+        return {
+            "answer": self.answer,
+            "runs": self.runs,
+            "warmup": self.warmup,
+            "outliers": self.outliers,
+            "min": self.min,
+            "median": self.median,
+            "mean": self.mean,
+            "p95": self.p95,
+            "max": self.max,
+            "stddev": self.stddev,
+        }
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    Linearly interpolated percentile of a list of values.
+
+    Args:
+        values: The values (need not be sorted)
+        pct: The percentile, between 0 and 100
+
+    Returns:
+        The interpolated percentile value
+    """
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def reject_outliers(samples: list[float]) -> list[float]:
+    """
+    Drop samples outside Tukey's fences (1.5 IQR beyond the quartiles).
+
+    Fewer than four samples are returned unchanged, as the quartiles are
+    meaningless at that size.
+    """
+    if len(samples) < 4:
+        return list(samples)
+    q1 = percentile(samples, 25)
+    q3 = percentile(samples, 75)
+    iqr = q3 - q1
+    low, high = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+    return [s for s in samples if low <= s <= high]
+
+
+def benchmark(
+    part_function: Callable[[str], Any],
+    input: str,
+    runs: int,
+    warmup: int = 1,
+) -> BenchmarkResult:
+    """
+    Time a part function over several runs after discarding warmup runs.
+
+    The function and its input are resolved by the caller, so the timed loop
+    contains no imports or I/O. Like timeit, garbage collection is disabled
+    while timing.
+
+    Args:
+        part_function: The solution part function to time
+        input: The puzzle input passed to every call
+        runs: Number of timed runs (at least 1)
+        warmup: Number of untimed runs before timing starts
+
+    Returns:
+        A BenchmarkResult with the raw samples and summary statistics
+    """
+    runs = max(runs, 1)
+    answer = None
+
+    for _ in range(warmup):
+        answer = part_function(input)
+
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(runs):
+            start = time.perf_counter()
+            answer = part_function(input)
+            samples.append(time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    kept = reject_outliers(samples)
+    return BenchmarkResult(
+        answer=str(answer),
+        samples=samples,
+        warmup=warmup,
+        outliers=len(samples) - len(kept),
+        kept=kept,
+    )
+
+
+def measure_peak_memory(part_function: Callable[[str], Any], input: str) -> int:
+    """
+    Run a part function once under tracemalloc and return its peak allocation.
+
+    This is a separate run from the timed ones, since tracing allocations
+    slows Python code down considerably.
+
+    Args:
+        part_function: The solution part function to run
+        input: The puzzle input
+
+    Returns:
+        Peak traced memory in bytes
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    try:
+        part_function(input)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+    return peak - baseline
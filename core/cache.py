@@ -0,0 +1,176 @@
+"""Project-owned on-disk cache of puzzle inputs, examples and accepted answers.
+
+Layout (under the project's .aoc directory):
+
+    cache/YYYY/DD/input.txt      - the puzzle input
+    cache/YYYY/DD/examples.json  - example inputs with their expected answers
+    cache/YYYY/DD/answers.json   - answers accepted by adventofcode.com
+
+Everything is written once, the first time aocd provides it, and read back
+with memory-mapped reads afterwards. aocd is only imported on a cache miss,
+so offline runs never touch the network or the aocd machinery.
+"""
+
+import json
+import mmap
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from utils.paths import get_data_dir
+
+
+class CacheMiss(LookupError):
+    """Raised when data is not cached and fetching it is not allowed (offline mode)."""
+
+
+@dataclass
+class Example:
+    """An example input with its expected answers (None when a part has no answer)."""
+
+    input_data: str
+    answer_a: Optional[str] = None
+    answer_b: Optional[str] = None
+
+
+def get_cache_dir(year: int, day: int) -> Path:
+    """
+    Get the cache directory of a puzzle.
+
+    Args:
+        year: The year of the puzzle
+        day: The day of the puzzle
+
+    Returns:
+        Path to the puzzle's cache directory (created if missing)
+    """
+    cache_dir = get_data_dir() / "cache" / str(year) / f"{day:02d}"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def _read_text(path: Path) -> str:
+    """Read a UTF-8 file through a read-only memory map (mmap rejects empty files)."""
+    with path.open("rb") as f:
+        if path.stat().st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped[:].decode("utf-8")
+
+
+def _write_text(path: Path, text: str) -> None:
+    """Write a file atomically, so an interrupted write never leaves a truncated cache entry."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def _aocd_puzzle(year: int, day: int):
+    """Construct an aocd Puzzle (imported here so cache hits never load aocd)."""
+    from aocd.models import Puzzle
+
+    return Puzzle(day=day, year=year)
+
+
+def get_input(year: int, day: int, offline: bool = False) -> str:
+    """
+    Get a puzzle input, fetching and caching it through aocd on a miss.
+
+    Args:
+        year: The year of the puzzle
+        day: The day of the puzzle
+        offline: Raise CacheMiss instead of fetching
+
+    Returns:
+        The puzzle input
+    """
+    path = get_cache_dir(year, day) / "input.txt"
+    if path.exists():
+        return _read_text(path)
+    if offline:
+        raise CacheMiss(f"No cached input for Year {year}, Day {day}")
+
+    input_data = _aocd_puzzle(year, day).input_data
+    _write_text(path, input_data)
+    return input_data
+
+
+def get_examples(year: int, day: int, offline: bool = False) -> list[Example]:
+    """
+    Get a puzzle's examples, extracting and caching them through aocd on a miss.
+
+    Args:
+        year: The year of the puzzle
+        day: The day of the puzzle
+        offline: Raise CacheMiss instead of fetching
+
+    Returns:
+        The examples (possibly empty)
+    """
+    path = get_cache_dir(year, day) / "examples.json"
+    if path.exists():
+        return [Example(**example) for example in json.loads(_read_text(path))]
+    if offline:
+        raise CacheMiss(f"No cached examples for Year {year}, Day {day}")
+
+    examples = [
+        Example(
+            input_data=example.input_data,
+            answer_a=None if example.answer_a is None else str(example.answer_a),
+            answer_b=None if example.answer_b is None else str(example.answer_b),
+        )
+        for example in _aocd_puzzle(year, day).examples
+    ]
+    _write_text(path, json.dumps([asdict(example) for example in examples], indent=2))
+    return examples
+
+
+def get_accepted_answer(year: int, day: int, part: str, fetch: bool = False) -> Optional[str]:
+    """
+    Get the cached accepted answer for a puzzle part.
+
+    Answers accepted on the website itself (not through this tool) only
+    reach the cache when fetch is set: aocd is then asked for the answer
+    shown on the puzzle page, and a known one is recorded.
+
+    Args:
+        year: The year of the puzzle
+        day: The day of the puzzle
+        part: The part of the puzzle ("a" or "b")
+        fetch: Ask aocd when no answer is cached (needs network access)
+
+    Returns:
+        The accepted answer, or None if none is known
+    """
+    path = get_cache_dir(year, day) / "answers.json"
+    answer = json.loads(_read_text(path)).get(part) if path.exists() else None
+    if answer is not None or not fetch:
+        return answer
+
+    from aocd.exceptions import AocdError
+
+    try:
+        # aocd raises AttributeError while the part is unsolved
+        answer = getattr(_aocd_puzzle(year, day), f"answer_{part}", None)
+    except AocdError:
+        return None
+    if not answer:
+        return None
+    record_accepted_answer(year, day, part, answer)
+    return str(answer)
+
+
+def record_accepted_answer(year: int, day: int, part: str, answer: str) -> None:
+    """
+    Store an answer that adventofcode.com accepted.
+
+    Args:
+        year: The year of the puzzle
+        day: The day of the puzzle
+        part: The part of the puzzle ("a" or "b")
+        answer: The accepted answer
+    """
+    path = get_cache_dir(year, day) / "answers.json"
+    answers = json.loads(_read_text(path)) if path.exists() else {}
+    answers[part] = str(answer)
+    _write_text(path, json.dumps(answers, indent=2))
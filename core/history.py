@@ -0,0 +1,212 @@
+"""Benchmark history store and regression detection."""
+
+import json
+import platform
+import subprocess
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+import typer
+
+from core.benchmark import BenchmarkResult
+from utils.display import console, display_comparison
+from utils.paths import get_data_dir
+
+HISTORY_FILE = "bench_history.jsonl"
+
+# Per-puzzle fields kept in the history; the rest of a report record is noise here
+HISTORY_FIELDS = ["year", "day", "part", "answer", "runs", "min", "median", "p95", "stddev", "peak_memory"]
+
+
+@dataclass
+class Comparison:
+    """Median runtime of one puzzle part against its baseline."""
+
+    year: int
+    day: int
+    part: str
+    baseline: float
+    current: float
+    baseline_commit: str
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def is_regression(self, threshold: float) -> bool:
+        """Whether the part slowed down by more than threshold (0.1 = 10%)."""
+        return self.ratio > 1 + threshold
+
+
+def get_history_path() -> Path:
+    """Path of the JSONL benchmark history file."""
+    return get_data_dir() / HISTORY_FILE
+
+
+def git_commit() -> str:
+    """Short hash of HEAD, suffixed with '-dirty' for uncommitted changes ('unknown' outside git)."""
+    cwd = Path(__file__).parent.parent
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=cwd, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=cwd, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def record_run(records: list[dict[str, Any]], path: Optional[Path] = None) -> dict[str, Any]:
+    """
+    Append a benchmark run to the history file.
+
+    Only successful records are stored. The run is tagged with the current
+    git commit and Python version.
+
+    Args:
+        records: Report records (as produced by the bench command)
+        path: History file to append to (defaults to .aoc/bench_history.jsonl)
+
+    Returns:
+        The stored history entry
+    """
+    entry = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "results": [
+            {field: record.get(field) for field in HISTORY_FIELDS}
+            for record in records
+            if record.get("status", "ok") == "ok"
+        ],
+    }
+    path = path or get_history_path()
+    with path.open("a") as f:
+        f.write(json.dumps(entry) + "\n")
+    return entry
+
+
+def load_history(path: Optional[Path] = None) -> list[dict[str, Any]]:
+    """Load all history entries, oldest first (empty if there is no history yet)."""
+    path = path or get_history_path()
+    if not path.exists():
+        return []
+    with path.open() as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def python_minor(version: str) -> str:
+    """Major.minor part of a Python version, e.g. "3.13" for "3.13.1"."""
+    return ".".join(version.split(".")[:2])
+
+
+def find_baseline(
+    history: list[dict[str, Any]],
+    commit: Optional[str] = None,
+    python: Optional[str] = python_minor(platform.python_version()),
+) -> dict[tuple[int, int, str], tuple[float, str]]:
+    """
+    Pick the baseline median for every puzzle part in the history.
+
+    The most recent entry wins for each part, so a baseline can be assembled
+    from several partial runs (e.g. `bench --year 2024` and `--year 2025`).
+
+    Args:
+        history: History entries, oldest first
+        commit: Only consider runs whose commit starts with this prefix
+        python: Only consider runs on this Python minor version (default:
+            the running interpreter's, so interpreter changes don't show up
+            as regressions); None accepts runs on any version
+
+    Returns:
+        Mapping of (year, day, part) to (baseline median, commit)
+    """
+    baseline = {}
+    for entry in history:
+        if commit is not None and not entry["commit"].startswith(commit):
+            continue
+        if python is not None and python_minor(entry["python"]) != python_minor(python):
+            continue
+        for result in entry["results"]:
+            key = (result["year"], result["day"], result["part"])
+            baseline[key] = (result["median"], entry["commit"])
+    return baseline
+
+
+def compare_to_baseline(
+    records: list[dict[str, Any]],
+    baseline: dict[tuple[int, int, str], tuple[float, str]],
+) -> list[Comparison]:
+    """
+    Compare the medians of a benchmark run against a baseline.
+
+    Parts that failed or have no baseline are left out.
+
+    Args:
+        records: Report records of the current run
+        baseline: Baseline medians as returned by find_baseline
+
+    Returns:
+        One Comparison per part present in both
+    """
+    comparisons = []
+    for record in records:
+        if record.get("status", "ok") != "ok":
+            continue
+        key = (record["year"], record["day"], record["part"])
+        if key not in baseline:
+            continue
+        baseline_median, baseline_commit = baseline[key]
+        comparisons.append(Comparison(*key, baseline_median, record["median"], baseline_commit))
+    return comparisons
+
+
+def make_record(year: int, day: int, part: str, result: BenchmarkResult, peak_memory: Optional[int] = None) -> dict[str, Any]:
+    """Report record for a successfully benchmarked puzzle part."""
+    return {
+        "year": year,
+        "day": day,
+        "part": part,
+        "status": "ok",
+        **result.to_dict(),
+        "peak_memory": peak_memory,
+        "error": None,
+    }
+
+
+def check_history(
+    records: list[dict[str, Any]],
+    save: bool,
+    compare: bool,
+    baseline: Optional[str],
+    threshold: float,
+) -> None:
+    """
+    Compare benchmark records against the history and/or append them to it.
+
+    The baseline is read before the run is saved, so a run never compares
+    against itself. Exits with code 1 when compare finds a regression.
+    """
+    comparisons = []
+    if compare:
+        history = load_history()
+        baseline_medians = find_baseline(history, commit=baseline)
+        if not baseline_medians and find_baseline(history, commit=baseline, python=None):
+            current = python_minor(platform.python_version())
+            console.print(f"[yellow]⚠ No baseline runs on Python {current}; runs on other versions are not compared[/yellow]")
+        comparisons = compare_to_baseline(records, baseline_medians)
+        console.print()
+        display_comparison(comparisons, threshold)
+
+    if save:
+        entry = record_run(records)
+        console.print(f"[green]✓ Saved run to the benchmark history (commit {entry['commit']}, Python {entry['python']})[/green]")
+
+    regressions = [c for c in comparisons if c.is_regression(threshold)]
+    if regressions:
+        console.print(f"[red]❌ {len(regressions)} part(s) regressed by more than {threshold:.0%}[/red]")
+        raise typer.Exit(code=1)
@@ -0,0 +1,180 @@
+"""Peak memory profiling of solution part functions, down to the lines holding the memory."""
+
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+
+@dataclass
+class AllocationSite:
+    """
+    Memory held by allocations made on one source line, at the traced peak.
+
+    Both figures are growth since the start of the run, in live bytes and
+    live blocks. tracemalloc only sees what is alive, so blocks allocated and
+    freed before the peak do not count: this is not a number of allocations.
+    """
+
+    location: str
+    size: int
+    block_growth: int
+
+
+@dataclass
+class MemoryProfile:
+    """
+    Result of a memory-profiled run (sizes in bytes, time in seconds).
+
+    block_growth is the growth in live blocks between the start of the run
+    and the traced peak, not a count of allocations.
+    """
+
+    answer: str
+    elapsed: float
+    peak_traced: int
+    block_growth: int
+    rss_start: Optional[int]
+    rss_peak: Optional[int]
+    top_sites: list[AllocationSite] = field(default_factory=list)
+
+    @property
+    def rss_growth(self) -> Optional[int]:
+        if self.rss_start is None or self.rss_peak is None:
+            return None
+        return self.rss_peak - self.rss_start
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes (None where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def max_rss() -> int:
+    """High-water resident set size of this process in bytes, as reported by getrusage."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class _Sampler(threading.Thread):
+    """Background thread that samples RSS and snapshots tracemalloc whenever the traced peak grows."""
+
+    def __init__(self, interval: float, growth: float = 1.5):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.growth = growth
+        self.rss_peak = current_rss()
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.snapshot_size = 0
+        self._stop_event = threading.Event()
+
+    def sample(self) -> None:
+        rss = current_rss()
+        if rss is not None and (self.rss_peak is None or rss > self.rss_peak):
+            self.rss_peak = rss
+        traced, _ = tracemalloc.get_traced_memory()
+        # Snapshots are expensive: only take one when memory grew noticeably
+        if traced > self.snapshot_size * self.growth:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = traced
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+        self.sample()
+
+
+def profile_memory(
+    part_function: Callable[[str], Any],
+    input: str,
+    top: int = 10,
+    interval: float = 0.01,
+) -> MemoryProfile:
+    """
+    Run a part function under tracemalloc while sampling RSS in a background thread.
+
+    The top allocation sites come from a snapshot taken close to the traced
+    peak, so they show what was holding memory at its highest point rather
+    than what happens to be left over at the end. Memory of worker processes
+    started by the solution is not included.
+
+    Args:
+        part_function: The solution part function to run
+        input: The puzzle input
+        top: Number of allocation sites to report
+        interval: Sampling interval in seconds
+
+    Returns:
+        A MemoryProfile with peak traced memory, RSS and the lines holding the most memory
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    rss_start = current_rss()
+    max_rss_start = max_rss()
+
+    sampler = _Sampler(interval)
+    sampler.start()
+    # Allocations alive before the run (input, modules, the sampler) are subtracted later
+    start_snapshot = tracemalloc.take_snapshot()
+    start_time = time.perf_counter()
+    try:
+        answer = part_function(input)
+        elapsed = time.perf_counter() - start_time
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        sampler.stop()
+        snapshot = sampler.snapshot
+        if not already_tracing:
+            tracemalloc.stop()
+
+    rss_peak = sampler.rss_peak
+    if rss_peak is not None and max_rss() > max_rss_start:
+        # The process high-water mark rose during the run, which also catches
+        # spikes shorter than the sampling interval
+        rss_peak = max(rss_peak, max_rss())
+
+    top_sites = []
+    block_growth = 0
+    if snapshot is not None:
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+        diffs = snapshot.filter_traces(filters).compare_to(start_snapshot.filter_traces(filters), "lineno")
+        grown = [diff for diff in diffs if diff.size_diff > 0]
+        grown.sort(key=lambda diff: diff.size_diff, reverse=True)
+        block_growth = sum(max(diff.count_diff, 0) for diff in grown)
+        top_sites = [
+            AllocationSite(
+                f"{diff.traceback[0].filename}:{diff.traceback[0].lineno}",
+                diff.size_diff,
+                max(diff.count_diff, 0),
+            )
+            for diff in grown[:top]
+        ]
+
+    return MemoryProfile(
+        answer=str(answer),
+        elapsed=elapsed,
+        peak_traced=peak - baseline,
+        block_growth=block_growth,
+        rss_start=rss_start,
+        rss_peak=rss_peak,
+        top_sites=top_sites,
+    )
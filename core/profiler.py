@@ -0,0 +1,263 @@
+"""Deterministic (cProfile) and sampling profilers for solution part functions."""
+
+import cProfile
+import json
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable, Optional
+
+from utils.paths import get_data_dir
+
+
+class ProfileMode(str, Enum):
+    cprofile = "cprofile"
+    sample = "sample"
+
+
+@dataclass
+class ProfileEntry:
+    """Time spent in one function (seconds); calls is None for sampled profiles."""
+
+    function: str
+    self_time: float
+    total_time: float
+    calls: Optional[int] = None
+
+
+@dataclass
+class ProfileResult:
+    """Answer, top functions and written profile files of a profiled run."""
+
+    answer: str
+    elapsed: float
+    mode: ProfileMode
+    entries: list[ProfileEntry] = field(default_factory=list)
+    files: list[Path] = field(default_factory=list)
+
+
+def get_profile_dir() -> Path:
+    """Directory where profile files are written (created if missing)."""
+    profile_dir = get_data_dir() / "profiles"
+    profile_dir.mkdir(exist_ok=True)
+    return profile_dir
+
+
+def _function_label(filename: str, lineno: int, name: str) -> str:
+    """Readable function label: name (file:line), with paths shortened to the file name."""
+    if filename == "~":
+        # cProfile's marker for C functions, whose name already reads like "<built-in method ...>"
+        return name
+    return f"{name} ({Path(filename).name}:{lineno})"
+
+
+def _collapsed_from_stats(stats: pstats.Stats, min_share: float = 1e-4) -> Counter:
+    """
+    Collapsed flamegraph stacks rebuilt from a cProfile call graph, weighted in microseconds.
+
+    cProfile records caller -> callee edges rather than whole stacks, so the
+    time spent below a function is split over the stacks leading to it in
+    proportion to the time of each call edge. Recursive calls are folded
+    into the outermost frame, and branches under min_share of the total
+    time are dropped to keep the number of stacks bounded.
+    """
+    callees = defaultdict(list)
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        for caller, (_, _, _, edge_time) in callers.items():
+            callees[caller].append((func, edge_time))
+
+    roots = [func for func, (_, _, _, _, callers) in stats.stats.items() if not callers]
+    min_time = min_share * sum(stats.stats[root][3] for root in roots)
+    collapsed: Counter = Counter()
+    pending = [(root, stats.stats[root][3], ()) for root in roots]
+    while pending:
+        func, path_time, path = pending.pop()
+        _, _, tottime, cumtime, _ = stats.stats[func]
+        if cumtime <= 0:
+            continue
+        path += (func,)
+        share = path_time / cumtime
+        own = round(tottime * share * 1e6)
+        if own > 0:
+            collapsed[";".join(_function_label(*frame) for frame in path)] += own
+        for callee, edge_time in callees[func]:
+            if callee not in path and edge_time * share >= min_time:
+                pending.append((callee, edge_time * share, path))
+    return collapsed
+
+
+def profile_cprofile(
+    part_function: Callable[[str], Any],
+    input: str,
+    output: Path,
+    top: int = 15,
+) -> ProfileResult:
+    """
+    Profile a part function with cProfile and write the stats in pstats format.
+
+    Also writes collapsed stacks rebuilt from the call graph (weights in
+    microseconds), so deterministic profiles open in flamegraph.pl, inferno
+    or speedscope like sampled ones.
+
+    Args:
+        part_function: The solution part function to profile
+        input: The puzzle input
+        output: Path prefix for the written files (".pstats" and ".collapsed" are appended)
+        top: Number of functions to report, by own (exclusive) time
+
+    Returns:
+        A ProfileResult with the top functions and the written files
+    """
+    profiler = cProfile.Profile()
+    start_time = time.perf_counter()
+    answer = profiler.runcall(part_function, input)
+    elapsed = time.perf_counter() - start_time
+
+    pstats_path = output.with_name(output.name + ".pstats")
+    profiler.dump_stats(pstats_path)
+
+    stats = pstats.Stats(profiler)
+    collapsed_path = output.with_name(output.name + ".collapsed")
+    collapsed = _collapsed_from_stats(stats)
+    collapsed_path.write_text("".join(f"{stack} {weight}\n" for stack, weight in collapsed.items()))
+
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)
+    entries = [
+        ProfileEntry(_function_label(*func), self_time=tottime, total_time=cumtime, calls=ncalls)
+        for func, (_, ncalls, tottime, cumtime, _) in rows[:top]
+    ]
+    return ProfileResult(str(answer), elapsed, ProfileMode.cprofile, entries, [pstats_path, collapsed_path])
+
+
+def _call_part(part_function: Callable[[str], Any], input: str) -> Any:
+    """
+    Call a part function; sampled stacks start just below this frame.
+
+    Cutting at this frame rather than at the part function's own code keeps
+    decorated and functools.partial-wrapped parts working, with their
+    wrappers on the stack.
+    """
+    return part_function(input)
+
+
+class _StackSampler(threading.Thread):
+    """Background thread that records the stack of one thread at a fixed interval."""
+
+    def __init__(self, thread_id: int, root_code, interval: float):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.root_code = root_code
+        self.interval = interval
+        self.samples: list[tuple[tuple[tuple[str, int, str], ...], float]] = []
+        self._stop_event = threading.Event()
+
+    def _stack(self, frame: Optional[FrameType]) -> tuple[tuple[str, int, str], ...]:
+        """Root-to-leaf stack of (filename, first line, function), cut below the root code's frame."""
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            if code is self.root_code:
+                break
+            stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+            frame = frame.f_back
+        else:
+            return ()  # The profiled function is not on the stack (yet or anymore)
+        return tuple(reversed(stack))
+
+    def run(self) -> None:
+        last = time.perf_counter()
+        while not self._stop_event.wait(self.interval):
+            now = time.perf_counter()
+            stack = self._stack(sys._current_frames().get(self.thread_id))
+            if stack:
+                self.samples.append((stack, now - last))
+            last = now
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+def profile_sample(
+    part_function: Callable[[str], Any],
+    input: str,
+    output: Path,
+    top: int = 15,
+    interval: float = 0.001,
+) -> ProfileResult:
+    """
+    Profile a part function by sampling its stack from a background thread.
+
+    Sampling has far less overhead than cProfile, so timings stay realistic.
+    Writes the samples as collapsed stacks (for flamegraph.pl / inferno) and
+    as a speedscope JSON file (https://www.speedscope.app).
+
+    Args:
+        part_function: The solution part function to profile
+        input: The puzzle input
+        output: Path prefix for the written files
+        top: Number of functions to report, by own (exclusive) time
+        interval: Sampling interval in seconds
+
+    Returns:
+        A ProfileResult with the top functions and the written files
+    """
+    sampler = _StackSampler(threading.get_ident(), _call_part.__code__, interval)
+    # The sampler only runs when it gets the GIL, so hand it over as often as we sample
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(interval)
+    sampler.start()
+    start_time = time.perf_counter()
+    try:
+        answer = _call_part(part_function, input)
+    finally:
+        elapsed = time.perf_counter() - start_time
+        sampler.stop()
+        sys.setswitchinterval(switch_interval)
+
+    samples = sampler.samples
+    self_time: Counter = Counter()
+    total_time: Counter = Counter()
+    collapsed: Counter = Counter()
+    for stack, weight in samples:
+        self_time[stack[-1]] += weight
+        for frame in set(stack):
+            total_time[frame] += weight
+        collapsed[";".join(_function_label(*frame) for frame in stack)] += 1
+
+    collapsed_path = output.with_name(output.name + ".collapsed")
+    collapsed_path.write_text("".join(f"{stack} {count}\n" for stack, count in collapsed.items()))
+
+    frames = sorted(total_time)
+    frame_index = {frame: i for i, frame in enumerate(frames)}
+    speedscope = {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {
+            "frames": [{"name": name, "file": filename, "line": lineno} for filename, lineno, name in frames],
+        },
+        "profiles": [{
+            "type": "sampled",
+            "name": output.name,
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": sum(weight for _, weight in samples),
+            "samples": [[frame_index[frame] for frame in stack] for stack, _ in samples],
+            "weights": [weight for _, weight in samples],
+        }],
+        "name": output.name,
+        "exporter": "aoc",
+    }
+    speedscope_path = output.with_name(output.name + ".speedscope.json")
+    speedscope_path.write_text(json.dumps(speedscope))
+
+    entries = [
+        ProfileEntry(_function_label(*frame), self_time=own, total_time=total_time[frame])
+        for frame, own in self_time.most_common(top)
+    ]
+    return ProfileResult(str(answer), elapsed, ProfileMode.sample, entries, [collapsed_path, speedscope_path])
@@ -1,27 +1,44 @@
 """Solution execution module."""
 
+import hashlib
 import importlib.util
 import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
 import typer
 from rich.console import Console
 
+from core.trace import span
 from utils.paths import get_solution_path
 
 console = Console()
 
+# Loaded solution modules, keyed on solution path.
+# Each entry holds (mtime_ns, size, sha256 of the source, module).
+_module_cache: dict[Path, tuple[int, int, str, ModuleType]] = {}
 
-def run(year: int, day: int, part: str, input: str) -> str:
+
+def _source_hash(path: Path) -> str:
+    """Return the sha256 hex digest of a file's contents."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def load_module(year: int, day: int) -> ModuleType:
     """
-    Dynamically import and run a solution module.
+    Import a solution module, reusing the cached copy when the file is unchanged.
+
+    The cache is checked against the file's mtime and size first; only when
+    those differ is the source hashed, so touching a file without editing it
+    does not trigger a re-import.
 
     Args:
         year: The year of the puzzle
         day: The day of the puzzle (1-25)
-        part: The part of the puzzle ("a" or "b")
-        input: The puzzle input data
 
     Returns:
-        The solution answer as a string
+        The imported solution module
     """
     module_path = get_solution_path(year, day)
 
@@ -29,6 +46,19 @@ def run(year: int, day: int, part: str, input: str) -> str:
         console.print(f"[red]Error: Solution file not found at {module_path}[/red]")
         raise typer.Exit(code=1)
 
+    stat = module_path.stat()
+    cached = _module_cache.get(module_path)
+    if cached is not None:
+        mtime_ns, size, _, module = cached
+        if (mtime_ns, size) == (stat.st_mtime_ns, stat.st_size):
+            return module
+
+    digest = _source_hash(module_path)
+    if cached is not None and cached[2] == digest:
+        # Touched but not edited: refresh the stamp and keep the module
+        _module_cache[module_path] = (stat.st_mtime_ns, stat.st_size, digest, cached[3])
+        return cached[3]
+
     # Load the module dynamically
     module_name = f"solutions.{year}.{day:02d}"
     spec = importlib.util.spec_from_file_location(module_name, module_path)
@@ -38,14 +68,54 @@ def run(year: int, day: int, part: str, input: str) -> str:
 
     module = importlib.util.module_from_spec(spec)
     sys.modules[module_name] = module
-    spec.loader.exec_module(module)
+    with span(f"import {module_name}"):
+        spec.loader.exec_module(module)
+
+    _module_cache[module_path] = (stat.st_mtime_ns, stat.st_size, digest, module)
+    return module
+
+
+def clear_module_cache() -> None:
+    """Forget all cached solution modules so the next run re-imports them."""
+    _module_cache.clear()
+
+
+def get_part_function(year: int, day: int, part: str) -> Callable[[str], Any]:
+    """
+    Look up the part function (a or b) of a solution module.
+
+    Args:
+        year: The year of the puzzle
+        day: The day of the puzzle (1-25)
+        part: The part of the puzzle ("a" or "b")
+
+    Returns:
+        The part function, taking the puzzle input and returning the answer
+    """
+    module = load_module(year, day)
 
-    # Call the part function from the module (a or b)
     if not hasattr(module, part):
-        console.print(f"[red]Error: Module {module_path} does not have a '{part}' function[/red]")
+        console.print(f"[red]Error: Module {module.__file__} does not have a '{part}' function[/red]")
         raise typer.Exit(code=1)
 
-    part_function = getattr(module, part)
+    return getattr(module, part)
+
+
+def run(year: int, day: int, part: str, input: str) -> str:
+    """
+    Dynamically import and run a solution module.
+
+    Args:
+        year: The year of the puzzle
+        day: The day of the puzzle (1-25)
+        part: The part of the puzzle ("a" or "b")
+        input: The puzzle input data
+
+    Returns:
+        The solution answer as a string
+    """
+    # Call the part function from the module (a or b)
+    part_function = get_part_function(year, day, part)
     result = part_function(input)
 
     # Convert result to string (handles any type that can be stringified)
@@ -0,0 +1,169 @@
+"""Run solution code in a supervised subprocess with a timeout and memory limit."""
+
+import multiprocessing
+import os
+import resource
+import signal
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# How often the parent checks the child's deadline and memory use (seconds)
+POLL_INTERVAL = 0.05
+
+
+@dataclass
+class SupervisedResult:
+    """
+    Outcome of a supervised run.
+
+    status is "ok", "error" (the target raised), "timeout", "memory" (memory
+    limit hit) or "crashed" (the child died without reporting back). elapsed
+    is the time until the result or, on a breach, until the kill.
+    """
+
+    status: str
+    elapsed: float
+    value: Any = None
+    error: Optional[str] = None
+
+
+@dataclass
+class Limits:
+    """Resource limits for a solution run (None means unlimited)."""
+
+    timeout: Optional[float] = None
+    max_memory: Optional[int] = None
+
+    @property
+    def active(self) -> bool:
+        return self.timeout is not None or self.max_memory is not None
+
+
+def _context() -> multiprocessing.context.BaseContext:
+    """Fork where available, so the child inherits loaded modules and needs no pickling of the target."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _child_main(conn, target: Callable[..., Any], args: tuple, max_memory: Optional[int]) -> None:
+    """Entry point of the supervised child: new process group, rlimit, run and report."""
+    # Own process group, so the supervisor can kill worker pools and managers along with us
+    os.setsid()
+    if max_memory is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (max_memory, max_memory))
+
+    start_time = time.perf_counter()
+    try:
+        value = target(*args)
+    except MemoryError:
+        limit = "" if max_memory is None else f" (limit {max_memory / 2**20:.0f}MiB)"
+        conn.send(("memory", time.perf_counter() - start_time, None, f"MemoryError{limit}"))
+    except BaseException as e:
+        conn.send(("error", time.perf_counter() - start_time, None, f"{type(e).__name__}: {e}"))
+    else:
+        conn.send(("ok", time.perf_counter() - start_time, value, None))
+    finally:
+        conn.close()
+
+
+def group_rss(pgid: int) -> Optional[int]:
+    """Total resident memory in bytes of all processes in a process group (None without /proc)."""
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    for stat_path in proc.glob("[0-9]*/stat"):
+        try:
+            # Fields after "(comm)": state, ppid, pgrp, ..., rss is the 22nd
+            fields = stat_path.read_text().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        if int(fields[2]) == pgid:
+            total += int(fields[21]) * page_size
+    return total
+
+
+def _kill_group(process: multiprocessing.Process) -> None:
+    """Kill the child's whole process group, falling back to the child alone."""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        # The child died, or had not called setsid yet
+        if process.is_alive():
+            process.kill()
+    process.join()
+
+
+def _crashed(process: multiprocessing.Process, elapsed: float) -> SupervisedResult:
+    """Result for a child that exited without reporting, with its exit code or signal."""
+    code = process.exitcode
+    if code is not None and code < 0:
+        reason = f"killed by {signal.Signals(-code).name}"
+    else:
+        reason = f"exit code {code}"
+    return SupervisedResult("crashed", elapsed, error=f"process died ({reason})")
+
+
+def run_supervised(
+    target: Callable[..., Any],
+    args: tuple = (),
+    timeout: Optional[float] = None,
+    max_memory: Optional[int] = None,
+) -> SupervisedResult:
+    """
+    Call target(*args) in a child process and kill it when it breaches a limit.
+
+    The child gets its own process group, and that whole group is killed
+    once the run finishes or breaches a limit, so multiprocessing pools or
+    managers the solution started cannot outlive it. The memory limit is
+    enforced twice: RLIMIT_AS in the child (inherited by its children)
+    raises MemoryError early, and the parent kills the group when the summed
+    RSS of the group exceeds it.
+
+    Args:
+        target: Function to run; its return value must be picklable
+        args: Positional arguments for target
+        timeout: Wall-clock limit in seconds (None for no limit)
+        max_memory: Memory limit in bytes (None for no limit)
+
+    Returns:
+        A SupervisedResult with the status, elapsed time and the return value
+    """
+    ctx = _context()
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_child_main, args=(child_conn, target, args, max_memory))
+
+    start_time = time.perf_counter()
+    process.start()
+    child_conn.close()
+
+    result = None
+    try:
+        while result is None:
+            if parent_conn.poll(POLL_INTERVAL):
+                try:
+                    status, elapsed, value, error = parent_conn.recv()
+                    result = SupervisedResult(status, elapsed, value, error)
+                except EOFError:
+                    # The child died without reporting back; the pipe stays readable
+                    # at EOF from now on, so stop polling and reap it
+                    process.join()
+                    result = _crashed(process, time.perf_counter() - start_time)
+                continue
+
+            elapsed = time.perf_counter() - start_time
+            if not process.is_alive():
+                result = _crashed(process, elapsed)
+            elif timeout is not None and elapsed >= timeout:
+                result = SupervisedResult("timeout", elapsed, error=f"timeout of {timeout:g}s exceeded")
+            elif max_memory is not None and (group_rss(process.pid) or 0) > max_memory:
+                result = SupervisedResult("memory", elapsed, error=f"memory use exceeded {max_memory / 2**20:.0f}MiB")
+    finally:
+        _kill_group(process)
+        parent_conn.close()
+
+    return result
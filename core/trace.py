@@ -0,0 +1,105 @@
+"""Lightweight per-phase latency tracing for the CLI pipeline."""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Optional
+
+
+@dataclass
+class Span:
+    """A named phase with perf_counter start/end timestamps (seconds)."""
+
+    name: str
+    start: float
+    end: float
+    depth: int = 0
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+@dataclass
+class Tracer:
+    """
+    Collects spans relative to an origin timestamp.
+
+    Recording a span is only a perf_counter call and a list append, so the
+    process-wide tracer is always on; --trace merely decides whether the
+    spans get displayed or written out.
+    """
+
+    origin: float = field(default_factory=time.perf_counter)
+    spans: list[Span] = field(default_factory=list)
+    marks: dict[str, float] = field(default_factory=dict)
+    _depth: int = 0
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Record the wrapped block as a span; spans opened inside it are nested."""
+        depth = self._depth
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth = depth
+            self.spans.append(Span(name, start, time.perf_counter(), depth))
+
+    def add(self, name: str, start: float, end: Optional[float] = None) -> None:
+        """Record a span from explicit timestamps (end defaults to now)."""
+        self.spans.append(Span(name, start, time.perf_counter() if end is None else end, self._depth))
+
+    def mark(self, name: str) -> None:
+        """Remember the current time under a name, for a span that ends elsewhere."""
+        self.marks[name] = time.perf_counter()
+
+    def add_since(self, mark: str, name: str) -> None:
+        """Record a span from a previous mark until now (ignored if the mark is unset)."""
+        if mark in self.marks:
+            self.add(name, self.marks.pop(mark))
+
+    def ordered(self) -> list[Span]:
+        """Spans in start order, outer spans before the spans nested in them."""
+        return sorted(self.spans, key=lambda s: (s.start, s.depth))
+
+    def total(self) -> float:
+        """Time from the origin to the end of the last span."""
+        return max((s.end for s in self.spans), default=self.origin) - self.origin
+
+    def to_chrome_trace(self) -> dict:
+        """Spans as Chrome trace-event JSON (load in chrome://tracing or Perfetto)."""
+        pid = os.getpid()
+        tid = threading.get_ident()
+        return {
+            "traceEvents": [
+                {
+                    "name": s.name,
+                    "ph": "X",
+                    "ts": (s.start - self.origin) * 1e6,
+                    "dur": s.duration * 1e6,
+                    "pid": pid,
+                    "tid": tid,
+                }
+                for s in self.ordered()
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write the spans as a Chrome trace-event JSON file."""
+        path.write_text(json.dumps(self.to_chrome_trace(), indent=2))
+
+
+# Process-wide tracer; main.py resets its origin to the start of the CLI
+tracer = Tracer()
+
+
+def span(name: str):
+    """Record a span on the process-wide tracer."""
+    return tracer.span(name)
@@ -1,19 +1,82 @@
 """Advent of Code CLI - Main entry point."""
 
+import time
+
+_start_time = time.perf_counter()
+
+import importlib
+
 from dotenv import load_dotenv
+import click
 import typer
+from typer.core import TyperGroup
+
+from core.trace import tracer
+
+# Trace phases relative to the start of this module, not to the import of core.trace
+tracer.origin = _start_time
+tracer.add("CLI imports", _start_time)
+
+with tracer.span("dotenv load"):
+    load_dotenv()
+
+
+class LazyGroup(TyperGroup):
+    """
+    Command group that imports a command's module only when that command is needed.
+
+    The top-level --help screen lists every command with its one-line help
+    from the registry below, so it imports none of the command modules.
+    """
+
+    # Command name -> ("module:function", one-line help), in the order shown by --help.
+    # Keep the help in sync with the first docstring line of the function.
+    lazy_commands = {
+        "solve": ("commands.solve:solve", "Run an Advent of Code solution for a specific puzzle."),
+        "new": ("commands.new:new", "Create a new solution file from boilerplate template."),
+        "bench": ("commands.bench:bench", "Benchmark every solution file on its real input."),
+        "run-all": ("commands.run_all:run_all", "Run several puzzle parts on their real input in parallel."),
+    }
+
+    _listing_only = False
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return list(self.lazy_commands)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.lazy_commands:
+            return None
+        target, short_help = self.lazy_commands[cmd_name]
+        if self._listing_only:
+            # Only the name and help are shown, so skip importing the module
+            return click.Command(cmd_name, short_help=short_help)
+
+        module_name, function_name = target.split(":")
+        function = getattr(importlib.import_module(module_name), function_name)
+
+        # Build the click command exactly as app.command() would have
+        command_app = typer.Typer(add_completion=False)
+        command_app.command(name=cmd_name)(function)
+        return typer.main.get_command(command_app)
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        self._listing_only = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing_only = False
 
-from commands.solve import solve
-from commands.new import new
 
-load_dotenv()
+app = typer.Typer(cls=LazyGroup, help="Advent of Code solution runner and manager")
 
-app = typer.Typer(help="Advent of Code solution runner and manager")
 
-# Register commands
-app.command()(solve)
-app.command()(new)
+# Typer cannot build an app that has neither registered commands nor a
+# callback; the empty callback makes it the group LazyGroup fills in
+@app.callback()
+def main():
+    pass
 
 
 if __name__ == "__main__":
+    tracer.mark("cli")
     app()
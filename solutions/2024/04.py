@@ -1,5 +1,7 @@
 from typing import Any
 
+from utils.grid import count_word, match_pattern, parse_grid
+
 
 def a(input: str) -> Any:
     """
@@ -11,54 +13,7 @@ def a(input: str) -> Any:
     Returns:
         The answer as something that can be parsed as string
     """
-
-    # TODO: Implement solution for part A
-    input = """MMMSXXMASM
-MSAMXMSMSA
-AMXSXMAAMM
-MSAMASMSMX
-XMASAMXAMM
-XXAMMXXAMA
-SMSMSASXSS
-SAXAMASAAA
-MAMMMXMMMM
-MXMXAXMASX"""
-
-    occurences = 0
-    lines = input.splitlines()
-    # horizontal checks
-    for l in lines:
-        occurences += l.count("XMAS")
-        occurences += l.count("SAMX")
-
-    # vertical checks:
-    for row in range(len(lines) - 4+1):
-        cols = len(lines[0])
-        for m in range(cols):
-            tmp = "".join(lines[n][m] for n in range(row, row+4))
-            if tmp in ["XMAS", "SAMX"]:
-                print("Vertical")
-                occurences += 1
-
-    # diagonals
-    rows = len(lines)
-    cols = len(lines[0])
-
-    for r in range(rows - 3):
-        for c in range(cols - 3):
-            # ↘ diagonal
-            tmp = "".join(lines[r+i][c+i] for i in range(4))
-            if tmp in ("XMAS", "SAMX"):
-                occurences += 1
-
-    for r in range(rows - 3):
-        for c in range(3, cols):
-            # ↙ diagonal
-            tmp = "".join(lines[r+i][c-i] for i in range(4))
-            if tmp in ("XMAS", "SAMX"):
-                occurences += 1
-
-    return occurences
+    return count_word(parse_grid(input), "XMAS")
 
 
 def b(input: str) -> Any:
@@ -71,19 +26,6 @@ def b(input: str) -> Any:
     Returns:
         The answer as something that can be parsed as string
     """
-
-#     input = """MMMSXXMASM
-# MSAMXMSMSA
-# AMXSXMAAMM
-# MSAMASMSMX
-# XMASAMXAMM
-# XXAMMXXAMA
-# SMSMSASXSS
-# SAXAMASAAA
-# MAMMMXMMMM
-# MXMXAXMASX"""
-
-
     pattern_variants = [
         ["M.S",
          ".A.",
@@ -100,26 +42,5 @@ def b(input: str) -> Any:
          "M.M"],
     ]
 
-    lines = input.splitlines()
-    rows = len(lines)
-    cols = len(lines[0])
-    occurrences = 0
-
-    def match_at(r, c, pat):
-        # pat is list of 3 strings length 3, '.' is wildcard
-        for i in range(3):
-            for j in range(3):
-                ch = pat[i][j]
-                if ch == ".":
-                    continue
-                if lines[r + i][c + j] != ch:
-                    return False
-        return True
-
-    for r in range(rows - 2):
-        for c in range(cols - 2):
-            for pat in pattern_variants:
-                if match_at(r, c, pat):
-                    occurrences += 1
-
-    return occurrences
+    grid = parse_grid(input)
+    return sum(int(match_pattern(grid, pattern).sum()) for pattern in pattern_variants)
@@ -1,5 +1,13 @@
 from typing import Any
 
+from utils.digits import sum_repeated
+from utils.intervals import RANGE_PATTERN
+
+
+def parse_ranges(input: str) -> list[tuple[int, int]]:
+    # every range as listed, so ids in overlapping ranges count once per range
+    return [(int(start), int(stop)) for start, stop in RANGE_PATTERN.findall(input)]
+
 
 def a(input: str) -> Any:
     """
@@ -11,37 +19,19 @@ def a(input: str) -> Any:
     Returns:
         The answer as something that can be parsed as string
     """
-    invalid_id_sum = 0
-    ranges = [_range.split("-") for _range in input.split(",")]
-    for _range in ranges:
-        for _id in range(int(_range[0]),int(_range[1])+1):
-            _id_str = str(_id)
-            if len(_id_str) % 2 == 0:
-                _part1 = _id_str[0:len(_id_str)//2]
-                _part2 = _id_str[len(_id_str)//2:]
-                if _part1 == _part2:
-                    invalid_id_sum += _id
-            else:
-                continue
-
-    return invalid_id_sum
+    # Invalid ids are a block of digits written twice (e.g. 6464)
+    return sum(sum_repeated(start, stop, repeats=2) for start, stop in parse_ranges(input))
 
 
-def chunkstring(string, length):
-    return [string[0+i:length+i] for i in range(0, len(string), length)]
-
+def b(input: str) -> Any:
+    """
+    Solution for part B.
 
-def check_invalid(_id: int):
-    _id = str(_id)
-    if _id in (_id+_id)[1:-1]:
-        return True
-    return False
+    Args:
+        input: The puzzle input as a string
 
-def b(input: str) -> Any:
-    invalid_id_sum = 0
-    ranges = [_range.split("-") for _range in input.split(",")]
-    for _range in ranges:
-        for _id in range(int(_range[0]),int(_range[1])+1):
-            if check_invalid(_id):
-                invalid_id_sum += _id
-    return invalid_id_sum
+    Returns:
+        The answer as something that can be parsed as string
+    """
+    # Invalid ids are a block of digits written at least twice (e.g. 123123123)
+    return sum(sum_repeated(start, stop) for start, stop in parse_ranges(input))
@@ -1,49 +1,17 @@
 from typing import Any
-import itertools
 
+from utils.grid import cells, erode, neighbour_counts, parse_grid
 
-def get_grid(input: str):
-    grid = {}
-    data = input.splitlines()
-    x_len = len(data[0])
-    y_len = len(data)
-    for y in range(y_len):
-        for x in range(x_len):
-            grid[(x,y)] = data[y][x]
-    return grid
 
-around = set(itertools.product([-1,0,1],[-1,0,1]))
-around.remove((0,0))
+def get_rolls(input: str):
+    return cells(parse_grid(input), "@")
 
-def can_remove(grid: dict):
-    to_remove = []
-    for coord, occupant in grid.items():
-        if occupant == "@":
-            neighbours = 0
-            for delta in around:
-                dx,dy = delta
-                x,y = coord
-                nx = x+dx
-                ny = y+dy
-                if (nx,ny) in grid and grid[(nx,ny)] == "@":
-                    neighbours += 1
-            if neighbours < 4:
-                to_remove.append((x,y))
-
-    return to_remove
 
 def a(input: str) -> Any:
-    grid = get_grid(input)
-    return len(can_remove(grid))
-
+    rolls = get_rolls(input)
+    return int((rolls & (neighbour_counts(rolls) < 4)).sum())
 
 
 def b(input: str) -> Any:
-    grid = get_grid(input)
-    total = 0
-    while to_remove := can_remove(grid):
-        for coord in to_remove:
-            grid[coord] = "."
-        removed = len(to_remove)
-        total += removed
-    return total
+    rolls = get_rolls(input)
+    return sum(len(rows) for rows, _ in erode(rolls, 4))
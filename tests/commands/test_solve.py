@@ -0,0 +1,37 @@
+"""Tests for the example checks of commands.solve."""
+
+import time
+
+import pytest
+import typer
+
+import commands.solve
+from core.cache import Example
+from core.supervisor import Limits
+
+
+def _hang(year, day, part, input):
+    time.sleep(60)
+
+
+def _echo(year, day, part, input):
+    return input
+
+
+def test_examples_pass_under_limits(monkeypatch):
+    monkeypatch.setattr(commands.solve, "run", _echo)
+    commands.solve._run_examples(2025, 1, "a", [Example("42", answer_a="42")], Limits(timeout=5))
+
+
+def test_runaway_example_is_killed(monkeypatch):
+    monkeypatch.setattr(commands.solve, "run", _hang)
+    start = time.perf_counter()
+    with pytest.raises(typer.Exit):
+        commands.solve._run_examples(2025, 1, "a", [Example("42", answer_a="42")], Limits(timeout=0.2))
+    assert time.perf_counter() - start < 5
+
+
+def test_wrong_example_answer_fails(monkeypatch):
+    monkeypatch.setattr(commands.solve, "run", _echo)
+    with pytest.raises(typer.Exit):
+        commands.solve._run_examples(2025, 1, "b", [Example("1", answer_b="2")], Limits())
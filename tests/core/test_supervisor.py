@@ -0,0 +1,74 @@
+"""Tests for core.supervisor."""
+
+import os
+import signal
+import time
+
+import pytest
+
+from core.supervisor import run_supervised
+
+# Generous bound for runs that must finish on their own; a hang fails instead of blocking the suite
+DEADLINE = 10.0
+
+
+def _supervise(*args, **kwargs):
+    """run_supervised, failing the test (via SIGALRM) if it does not return before DEADLINE."""
+    def expire(signum, frame):
+        pytest.fail(f"run_supervised did not return within {DEADLINE:g}s")
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, DEADLINE)
+    try:
+        return run_supervised(*args, **kwargs)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _kill_self():
+    os.kill(os.getpid(), signal.SIGKILL)
+
+
+def _raise():
+    raise ValueError("bad input")
+
+
+def _allocate(size):
+    return len(bytearray(size))
+
+
+def test_ok_returns_value():
+    result = _supervise(sum, ([1, 2, 3],))
+    assert result.status == "ok"
+    assert result.value == 6
+
+
+def test_error_is_reported():
+    result = _supervise(_raise)
+    assert result.status == "error"
+    assert result.error == "ValueError: bad input"
+
+
+def test_child_killed_by_signal_is_crashed():
+    result = _supervise(_kill_self, timeout=DEADLINE / 2)
+    assert result.status == "crashed"
+    assert "SIGKILL" in result.error
+
+
+def test_child_exiting_without_reporting_is_crashed():
+    result = _supervise(os._exit, (3,), timeout=DEADLINE / 2)
+    assert result.status == "crashed"
+    assert "exit code 3" in result.error
+
+
+def test_timeout_kills_child():
+    start = time.perf_counter()
+    result = _supervise(time.sleep, (DEADLINE,), timeout=0.2)
+    assert result.status == "timeout"
+    assert time.perf_counter() - start < DEADLINE / 2
+
+
+def test_memory_limit():
+    result = _supervise(_allocate, (512 * 2**20,), max_memory=128 * 2**20)
+    assert result.status == "memory"
@@ -0,0 +1,21 @@
+"""Published examples for 2024 day 4."""
+
+from core.runner import get_part_function
+
+EXAMPLE = """\
+MMMSXXMASM
+MSAMXMSMSA
+AMXSXMAAMM
+MSAMASMSMX
+XMASAMXAMM
+XXAMMXXAMA
+SMSMSASXSS
+SAXAMASAAA
+MAMMMXMMMM
+MXMXAXMASX
+"""
+
+
+def test_example():
+    assert get_part_function(2024, 4, "a")(EXAMPLE) == 18
+    assert get_part_function(2024, 4, "b")(EXAMPLE) == 9
@@ -0,0 +1,19 @@
+"""Published examples for 2025 day 2."""
+
+from core.runner import get_part_function
+
+EXAMPLE = (
+    "11-22,95-115,998-1012,1188511880-1188511890,222220-222224,"
+    "1698522-1698528,446443-446449,38593856-38593862,565653-565659,"
+    "824824821-824824827,2121212118-2121212124"
+)
+
+
+def test_example():
+    assert get_part_function(2025, 2, "a")(EXAMPLE) == 1227775554
+    assert get_part_function(2025, 2, "b")(EXAMPLE) == 4174379265
+
+
+def test_overlapping_ranges_count_per_range():
+    # 22 and 33 lie in both ranges, like the original per-range loop counted them
+    assert get_part_function(2025, 2, "a")("11-33,20-40") == 11 + 22 + 33 + 22 + 33
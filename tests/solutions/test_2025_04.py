@@ -0,0 +1,21 @@
+"""Published examples for 2025 day 4."""
+
+from core.runner import get_part_function
+
+EXAMPLE = """\
+..@@.@@@@.
+@@@.@.@.@@
+@@@@@.@.@@
+@.@@@@..@.
+@@.@@@@.@@
+.@@@@@@@.@
+.@.@.@.@@@
+@.@@@.@@@@
+.@@@@@@@@.
+@.@.@@@.@.
+"""
+
+
+def test_example():
+    assert get_part_function(2025, 4, "a")(EXAMPLE) == 13
+    assert get_part_function(2025, 4, "b")(EXAMPLE) == 43
@@ -0,0 +1,22 @@
+"""Published examples for 2025 day 5."""
+
+from core.runner import get_part_function
+
+EXAMPLE = """\
+3-5
+10-14
+16-20
+12-18
+
+1
+5
+8
+11
+17
+32
+"""
+
+
+def test_example():
+    assert get_part_function(2025, 5, "a")(EXAMPLE) == 3
+    assert get_part_function(2025, 5, "b")(EXAMPLE) == 14
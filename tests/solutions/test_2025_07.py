@@ -0,0 +1,46 @@
+"""Published examples for 2025 day 7."""
+
+from core.runner import get_part_function
+
+EXAMPLE = """\
+.......S.......
+...............
+.......^.......
+...............
+......^.^......
+...............
+.....^.^.^.....
+...............
+....^.^...^....
+...............
+...^.^...^.^...
+...............
+..^...^.....^..
+...............
+.^.^.^.^.^...^.
+...............
+"""
+
+# Side-by-side splitters, where the original in-place row scan let every
+# other one of a run pass its beam (part a) while part b split at all of them
+ADJACENT = """\
+....S....
+....^....
+.........
+...^.^...
+.........
+..^...^..
+.........
+.^^^^^^^.
+.........
+"""
+
+
+def test_example():
+    assert get_part_function(2025, 7, "a")(EXAMPLE) == 21
+    assert get_part_function(2025, 7, "b")(EXAMPLE) == 40
+
+
+def test_adjacent_splitters_match_original():
+    assert get_part_function(2025, 7, "a")(ADJACENT) == 9
+    assert get_part_function(2025, 7, "b")(ADJACENT) == 12
@@ -0,0 +1,33 @@
+"""Published examples for 2025 day 8."""
+
+from core.runner import get_part_function
+
+EXAMPLE = """\
+162,817,812
+57,618,57
+906,360,560
+592,479,940
+352,342,300
+466,668,158
+542,29,236
+431,825,988
+739,650,466
+52,470,668
+216,146,977
+819,987,18
+117,168,530
+805,96,715
+346,949,466
+970,615,88
+941,993,340
+862,61,35
+984,92,344
+425,690,689
+"""
+
+
+def test_example():
+    # Part a connects a fixed 1000 pairs (10 in the example), so on 20
+    # points it joins them all into one circuit
+    assert get_part_function(2025, 8, "a")(EXAMPLE) == 20
+    assert get_part_function(2025, 8, "b")(EXAMPLE) == 25272
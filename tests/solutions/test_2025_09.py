@@ -0,0 +1,29 @@
+"""Published examples for 2025 day 9."""
+
+from core.runner import get_part_function
+
+EXAMPLE = """\
+7,1
+11,1
+11,7
+9,7
+9,5
+2,5
+2,3
+7,3
+"""
+
+
+def test_example():
+    assert get_part_function(2025, 9, "a")(EXAMPLE) == 50
+    assert get_part_function(2025, 9, "b")(EXAMPLE) == 24
+
+
+def test_zero_width_notch():
+    notch = "0,0\n3,0\n3,5\n4,5\n4,0\n8,0\n8,8\n0,8\n"
+    assert get_part_function(2025, 9, "b")(notch) == 81
+
+
+def test_too_few_red_tiles():
+    assert get_part_function(2025, 9, "b")("") == 0
+    assert get_part_function(2025, 9, "b")("3,4\n") == 0
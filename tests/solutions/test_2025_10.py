@@ -0,0 +1,28 @@
+"""Published examples for 2025 day 10."""
+
+import pytest
+
+from core.runner import get_part_function
+
+EXAMPLE = """\
+[.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}
+[...#.] (0,2,3,4) (2,3) (0,4) (0,1,2) (1,2,3,4) {7,5,12,7,2}
+[.###.#] (0,1,2,3,4) (0,3,4) (0,1,2,4,5) (1,2) {10,11,11,5,10,5}
+"""
+
+# The second machine's light 1 and counter 1 are wired to no button
+UNREACHABLE = """\
+[.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}
+[.#] (0) {1,1}
+"""
+
+
+def test_example():
+    assert get_part_function(2025, 10, "a")(EXAMPLE) == 7
+    assert get_part_function(2025, 10, "b")(EXAMPLE) == 33
+
+
+@pytest.mark.parametrize("part", ["a", "b"])
+def test_unreachable_machine_names_the_line(part):
+    with pytest.raises(ValueError, match="Line 2"):
+        get_part_function(2025, 10, part)(UNREACHABLE)
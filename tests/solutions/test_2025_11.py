@@ -0,0 +1,37 @@
+"""Published examples for 2025 day 11."""
+
+from core.runner import get_part_function
+
+EXAMPLE_A = """\
+aaa: you hhh
+you: bbb ccc
+bbb: ddd eee
+ccc: ddd eee fff
+ddd: ggg
+eee: out
+fff: out
+ggg: out
+hhh: ccc fff iii
+iii: out
+"""
+
+EXAMPLE_B = """\
+svr: aaa bbb
+aaa: fft
+fft: ccc
+bbb: tty
+tty: ccc
+ccc: ddd eee
+ddd: hub
+hub: fff
+eee: dac
+dac: fff
+fff: ggg hhh
+ggg: out
+hhh: out
+"""
+
+
+def test_example():
+    assert get_part_function(2025, 11, "a")(EXAMPLE_A) == 5
+    assert get_part_function(2025, 11, "b")(EXAMPLE_B) == 2
@@ -0,0 +1,56 @@
+"""Tests for utils.dag."""
+
+import itertools
+import random
+
+import pytest
+
+from utils.dag import DAG
+
+
+def _simple_paths(adjacency, source, destination):
+    """Reference: enumerate paths by depth-first search."""
+    if source == destination:
+        return [[source]]
+    return [[source, *rest] for nxt in adjacency.get(source, []) for rest in _simple_paths(adjacency, nxt, destination)]
+
+
+def test_interning_and_csr():
+    graph = DAG.from_text("a: b c\nb: c\n")
+    assert len(graph) == 3
+    assert "c" in graph and "d" not in graph
+    assert graph.successors("a") == ["b", "c"]
+    assert graph.successors("c") == []
+    assert graph.offsets == [0, 2, 3, 3]
+    with pytest.raises(KeyError):
+        graph.node("d")
+
+
+def test_rejects_cycles():
+    with pytest.raises(ValueError):
+        DAG({"a": ["b"], "b": ["a"]})
+
+
+def test_count_paths_many_pairs():
+    graph = DAG({"s": ["a", "b"], "a": ["c", "t"], "b": ["c"], "c": ["t"]})
+    counts = graph.count_paths([("s", "t"), ("a", "t"), ("s", "c"), ("t", "s"), ("c", "c")])
+    assert counts == {("s", "t"): 3, ("a", "t"): 2, ("s", "c"): 2, ("t", "s"): 0, ("c", "c"): 1}
+
+
+def test_deep_graph_has_no_recursion_limit():
+    chain = {f"n{i}": [f"n{i + 1}"] for i in range(20_000)}
+    assert DAG(chain).count_paths_via("n0", "n20000") == 1
+
+
+def test_matches_path_enumeration():
+    rng = random.Random(24)
+    for _ in range(100):
+        names = [f"v{i}" for i in range(rng.randint(2, 9))]
+        adjacency = {u: [v for v in names[i + 1:] if rng.random() < 0.4] for i, u in enumerate(names)}
+        graph = DAG(adjacency)
+        source, destination = names[0], names[-1]
+        paths = _simple_paths(adjacency, source, destination)
+        assert graph.count_paths_via(source, destination) == len(paths)
+        for waypoints in itertools.combinations(names[1:-1], 2):
+            expected = sum(all(w in path for w in waypoints) for path in paths)
+            assert graph.count_paths_via(source, destination, list(waypoints)) == expected
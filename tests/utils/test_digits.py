@@ -0,0 +1,41 @@
+"""Tests for utils.digits."""
+
+import random
+
+from utils.digits import iter_repeated, sum_repeated
+
+
+def _brute_force(lo, hi, repeats=None):
+    found = []
+    for n in range(lo, hi + 1):
+        s = str(n)
+        if repeats is None:
+            if s in (s + s)[1:-1]:
+                found.append(n)
+        elif len(s) % repeats == 0 and s == s[:len(s) // repeats] * repeats:
+            found.append(n)
+    return found
+
+
+def test_small_ranges():
+    assert list(iter_repeated(11, 22, repeats=2)) == [11, 22]
+    assert list(iter_repeated(95, 115)) == [99, 111]
+    assert sum_repeated(998, 1012, repeats=2) == 1010
+    assert sum_repeated(998, 1012) == 999 + 1010
+
+
+def test_counts_each_number_once():
+    # 1111 is 1 x4 and 11 x2, but only one number
+    assert list(iter_repeated(1111, 1111)) == [1111]
+    assert sum_repeated(1111, 1111) == 1111
+
+
+def test_matches_brute_force():
+    rng = random.Random(2025)
+    for _ in range(100):
+        lo = rng.randrange(1, 200_000)
+        hi = lo + rng.randrange(0, 5_000)
+        for repeats in (None, 2, 3):
+            expected = _brute_force(lo, hi, repeats)
+            assert list(iter_repeated(lo, hi, repeats)) == expected
+            assert sum_repeated(lo, hi, repeats) == sum(expected)
@@ -0,0 +1,49 @@
+"""Tests for utils.frontier and the grid erosion built on it."""
+
+import numpy as np
+
+from utils.frontier import peel
+from utils.grid import erode, neighbour_counts, neighbour_table
+
+
+def _erode_by_rounds(mask, min_neighbours):
+    """Reference: recount every cell in every round."""
+    mask = mask.copy()
+    rounds = []
+    while True:
+        removed = mask & (neighbour_counts(mask) < min_neighbours)
+        if not removed.any():
+            return rounds
+        rounds.append(sorted(zip(*np.nonzero(removed))))
+        mask &= ~removed
+
+
+def test_peel_on_a_path_graph():
+    # 0 - 1 - 2 - 3 - 4, with index 5 as the missing neighbour
+    neighbours = np.array([[5, 1], [0, 2], [1, 3], [2, 4], [3, 5]])
+    alive = np.ones(5, dtype=bool)
+    rounds = [sorted(r.tolist()) for r in peel(alive, neighbours, 2)]
+    assert rounds == [[0, 4], [1, 3], [2]]
+    assert alive.all()
+
+
+def test_peel_keeps_stable_nodes():
+    # A triangle survives with two neighbours each; the pendant node 3 does not
+    neighbours = np.array([[1, 2, 4], [0, 2, 4], [0, 1, 3], [2, 4, 4]])
+    rounds = [r.tolist() for r in peel(np.ones(4, dtype=bool), neighbours, 2)]
+    assert rounds == [[3]]
+
+
+def test_erode_matches_round_based_reference():
+    rng = np.random.default_rng(15)
+    for _ in range(50):
+        mask = rng.random((rng.integers(1, 12), rng.integers(1, 12))) < 0.7
+        got = [sorted(zip(rows.tolist(), cols.tolist())) for rows, cols in erode(mask, 4)]
+        expected = [[(int(r), int(c)) for r, c in removed] for removed in _erode_by_rounds(mask, 4)]
+        assert got == expected
+
+
+def test_neighbour_table_marks_missing_neighbours():
+    table = neighbour_table((2, 2), diagonal=False)
+    # Cell 0 (top left) has neighbours right (1) and below (2); up and left are missing (4)
+    assert sorted(table[0].tolist()) == [1, 2, 4, 4]
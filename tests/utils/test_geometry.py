@@ -0,0 +1,77 @@
+"""Tests for utils.geometry."""
+
+import numpy as np
+import pytest
+
+from utils.geometry import RectilinearPolygon
+
+# The published 2025 day 9 example
+EXAMPLE = [(7, 1), (11, 1), (11, 7), (9, 7), (9, 5), (2, 5), (2, 3), (7, 3)]
+
+# An 8x8 square with a notch from the bottom edge between x=3 and x=4, which
+# holds no integer tiles: every tile of the square is still covered
+NOTCH = [(0, 0), (3, 0), (3, 5), (4, 5), (4, 0), (8, 0), (8, 8), (0, 8)]
+
+
+def _tiles(vertices, x_range, y_range):
+    """Brute-force tile membership by rasterising the edges and casting rays."""
+    edges = list(zip(vertices, vertices[1:] + vertices[:1]))
+    inside = set()
+    for x in x_range:
+        for y in y_range:
+            if any(min(a[0], b[0]) <= x <= max(a[0], b[0]) and min(a[1], b[1]) <= y <= max(a[1], b[1]) for a, b in edges):
+                inside.add((x, y))
+                continue
+            crossings = sum(a[0] == b[0] and a[0] > x and min(a[1], b[1]) < y + 0.5 < max(a[1], b[1]) for a, b in edges)
+            if crossings % 2:
+                inside.add((x, y))
+    return inside
+
+
+def test_points_match_brute_force():
+    polygon = RectilinearPolygon(EXAMPLE)
+    inside = _tiles(EXAMPLE, range(0, 14), range(0, 10))
+    for x in range(0, 14):
+        for y in range(0, 10):
+            assert ((x, y) in polygon) == ((x, y) in inside), (x, y)
+
+
+def test_contains_rect_example():
+    polygon = RectilinearPolygon(EXAMPLE)
+    assert polygon.contains_rect((9, 5), (2, 3))
+    assert polygon.contains_rect((7, 3), (11, 1))
+    assert not polygon.contains_rect((2, 5), (11, 1))
+    assert not polygon.contains_rect((2, 3), (11, 7))
+
+
+def test_zero_width_notch_holds_no_tiles():
+    polygon = RectilinearPolygon(NOTCH)
+    assert polygon.contains_rect((0, 0), (8, 8))
+    assert polygon.contains_rect((3, 0), (4, 0))
+    assert all((x, y) in polygon for x in range(9) for y in range(9))
+
+
+def test_notch_in_both_directions():
+    # The same notch on the left edge, so the empty gap is a row instead of a column
+    transposed = [(y, x) for x, y in NOTCH]
+    assert RectilinearPolygon(transposed).contains_rect((0, 0), (8, 8))
+
+
+def test_wide_notch_is_outside():
+    notched = [(0, 0), (3, 0), (3, 5), (5, 5), (5, 0), (8, 0), (8, 8), (0, 8)]
+    polygon = RectilinearPolygon(notched)
+    assert (4, 2) not in polygon
+    assert not polygon.contains_rect((0, 0), (8, 8))
+    assert polygon.contains_rect((0, 5), (8, 8))
+
+
+def test_contains_rects_matches_contains_rect():
+    polygon = RectilinearPolygon(EXAMPLE)
+    corners = np.array([(a, b) for a in EXAMPLE for b in EXAMPLE])
+    expected = [polygon.contains_rect(tuple(c[:2]), tuple(c[2:])) for c in corners.reshape(-1, 4)]
+    assert polygon.contains_rects(corners[:, 0], corners[:, 1]).tolist() == expected
+
+
+def test_rejects_diagonal_edges():
+    with pytest.raises(ValueError):
+        RectilinearPolygon([(0, 0), (2, 2), (0, 2)])
@@ -0,0 +1,51 @@
+"""Tests for utils.gf2."""
+
+import random
+
+from utils.gf2 import min_weight_solution, solution_space
+
+
+def _apply(columns, x):
+    result = 0
+    for i, column in enumerate(columns):
+        if x >> i & 1:
+            result ^= column
+    return result
+
+
+def test_example_machine():
+    # [.##.] with buttons (3) (1,3) (2) (2,3) (0,2) (0,1): two presses
+    columns = [0b1000, 0b1010, 0b0100, 0b1100, 0b0101, 0b0011]
+    x = min_weight_solution(columns, 0b0110)
+    assert _apply(columns, x) == 0b0110
+    assert x.bit_count() == 2
+
+
+def test_no_solution():
+    assert solution_space([0b01, 0b01], 0b10) is None
+    assert min_weight_solution([0b11], 0b01) is None
+    assert min_weight_solution([], 0b1) is None
+    assert min_weight_solution([], 0) == 0
+
+
+def test_solution_space_spans_all_solutions():
+    rng = random.Random(22)
+    for _ in range(100):
+        m, n = rng.randint(1, 5), rng.randint(1, 6)
+        columns = [rng.randrange(1 << m) for _ in range(n)]
+        target = rng.randrange(1 << m)
+        expected = {x for x in range(1 << n) if _apply(columns, x) == target}
+        space = solution_space(columns, target)
+        if not expected:
+            assert space is None
+            continue
+        particular, basis = space
+        found = set()
+        for mask in range(1 << len(basis)):
+            x = particular
+            for k, vector in enumerate(basis):
+                if mask >> k & 1:
+                    x ^= vector
+            found.add(x)
+        assert found == expected
+        assert min_weight_solution(columns, target).bit_count() == min(x.bit_count() for x in expected)
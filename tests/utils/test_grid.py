@@ -0,0 +1,139 @@
+"""Tests for utils.grid."""
+
+import random
+
+import numpy as np
+import pytest
+
+from utils.grid import (
+    NEIGHBOURS_4,
+    NEIGHBOURS_8,
+    cells,
+    count_word,
+    find,
+    flow_counts,
+    flow_down,
+    match_pattern,
+    match_word,
+    neighbour_counts,
+    parse_grid,
+)
+
+# Side-by-side splitters in the last splitter row, reached in columns 1, 3, 4, 5 and 7
+ADJACENT = """\
+....S....
+....^....
+.........
+...^.^...
+.........
+..^...^..
+.........
+.^^^^^^^.
+.........
+"""
+
+
+def test_parse_grid_pads_short_lines():
+    grid = parse_grid("ab\nc\n", fill=".")
+    assert grid.dtype == np.uint8
+    assert grid.shape == (2, 2)
+    assert bytes(grid.ravel()).decode() == "abc."
+
+
+def test_cells_and_find():
+    grid = parse_grid("a.b\n.ba\n")
+    assert cells(grid, "ab").tolist() == [[True, False, True], [False, True, True]]
+    assert find(grid, "b") == (0, 2)
+    with pytest.raises(ValueError):
+        find(grid, "z")
+
+
+@pytest.mark.parametrize("diagonal", [True, False])
+def test_neighbour_counts_match_brute_force(diagonal):
+    rng = np.random.default_rng(4)
+    mask = rng.random((7, 9)) < 0.5
+    steps = NEIGHBOURS_8 if diagonal else NEIGHBOURS_4
+    expected = np.zeros(mask.shape, dtype=int)
+    for r in range(mask.shape[0]):
+        for c in range(mask.shape[1]):
+            expected[r, c] = sum(
+                mask[r + dr, c + dc]
+                for dr, dc in steps
+                if 0 <= r + dr < mask.shape[0] and 0 <= c + dc < mask.shape[1]
+            )
+    assert neighbour_counts(mask, diagonal).tolist() == expected.tolist()
+
+
+def test_match_word_stays_inside_the_grid():
+    grid = parse_grid("XMAS\nSAMX\n")
+    assert np.argwhere(match_word(grid, "XMAS", (0, 1))).tolist() == [[0, 0]]
+    assert np.argwhere(match_word(grid, "XMAS", (0, -1))).tolist() == [[1, 3]]
+    assert not match_word(grid, "XMAS", (1, 0)).any()
+
+
+def test_count_word_matches_brute_force():
+    rng = random.Random(14)
+    text = "\n".join("".join(rng.choice("XMAS") for _ in range(12)) for _ in range(10))
+    lines = text.splitlines()
+    expected = 0
+    for r in range(len(lines)):
+        for c in range(len(lines[0])):
+            for dr, dc in NEIGHBOURS_8:
+                positions = [(r + k * dr, c + k * dc) for k in range(4)]
+                if all(0 <= pr < len(lines) and 0 <= pc < len(lines[0]) for pr, pc in positions):
+                    expected += "".join(lines[pr][pc] for pr, pc in positions) == "XMAS"
+    assert count_word(parse_grid(text), "XMAS") == expected
+
+
+def test_match_pattern_wildcards():
+    grid = parse_grid("M.S.\n.A..\nM.S.\n")
+    matches = match_pattern(grid, ["M.S", ".A.", "M.S"])
+    assert np.argwhere(matches).tolist() == [[0, 0]]
+
+
+def _sweep(text, **kwargs):
+    grid = parse_grid(text)
+    return list(flow_down(cells(grid, "^"), find(grid, "S"), **kwargs))
+
+
+def test_flow_down_splits_and_merges():
+    rows = _sweep("..S..\n.....\n..^..\n.....\n")
+    assert [split.tolist() for split, _ in rows] == [
+        [False] * 5,
+        [False, False, True, False, False],
+        [False] * 5,
+    ]
+    assert rows[-1][1].tolist() == [0, 1, 0, 1, 0]
+
+
+def test_flow_down_counts_paths():
+    # Both beams of the first splitter meet again below the second row of splitters
+    counts = flow_counts(cells(parse_grid("..S..\n..^..\n.^.^.\n"), "^"), (0, 2))
+    assert counts.tolist() == [1, 0, 2, 0, 1]
+
+
+def test_flow_down_drops_beams_leaving_the_grid():
+    counts = flow_counts(cells(parse_grid("S..\n^..\n"), "^"), (0, 0))
+    assert counts.tolist() == [0, 1, 0]
+
+
+def test_shadow_lets_every_other_adjacent_splitter_through():
+    last_split = _sweep(ADJACENT, shadow=True)[6][0]
+    assert np.flatnonzero(last_split).tolist() == [1, 3, 5, 7]
+    assert np.flatnonzero(_sweep(ADJACENT)[6][0]).tolist() == [1, 3, 4, 5, 7]
+
+
+def test_flow_counts_exact_with_object_dtype():
+    # 70 rows of splitters, offset like a Galton board, take the path total past 2^63
+    width = 141
+    rows = ["." * 70 + "S" + "." * 70]
+    for i in range(70):
+        rows.append("".join("^" if (c + i) % 2 == 0 and 0 < c < width - 1 else "." for c in range(width)))
+    grid = parse_grid("\n".join(rows))
+    counts = flow_counts(cells(grid, "^"), find(grid, "S"), dtype=object)
+    assert all(isinstance(v, int) for v in counts.tolist())
+    assert sum(counts) > 2**63
+
+
+def test_flow_counts_without_rows_below():
+    assert flow_counts(np.zeros((1, 3), dtype=bool), (0, 1)).tolist() == [0, 1, 0]
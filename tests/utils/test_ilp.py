@@ -0,0 +1,65 @@
+"""Tests for utils.ilp."""
+
+import itertools
+import random
+
+import pytest
+
+from utils.ilp import solve_min_sum
+
+
+def _brute_force(matrix, target, bound):
+    """Smallest sum(x) over all x in [0, bound]^n with matrix @ x == target, or None."""
+    n = len(matrix[0])
+    best = None
+    for x in itertools.product(range(bound + 1), repeat=n):
+        if all(sum(a * v for a, v in zip(row, x)) == t for row, t in zip(matrix, target)):
+            if best is None or sum(x) < best:
+                best = sum(x)
+    return best
+
+
+def _check(matrix, target, solution):
+    assert all(v >= 0 for v in solution)
+    assert [sum(a * v for a, v in zip(row, solution)) for row in matrix] == list(target)
+
+
+def test_example_machine():
+    # Buttons (3) (1,3) (2) (2,3) (0,2) (0,1) with joltages {3,5,4,7}: 10 presses
+    buttons = [(3,), (1, 3), (2,), (2, 3), (0, 2), (0, 1)]
+    target = [3, 5, 4, 7]
+    matrix = [[int(j in b) for b in buttons] for j in range(len(target))]
+    solution = solve_min_sum(matrix, target)
+    _check(matrix, target, solution)
+    assert sum(solution) == 10
+
+
+def test_infeasible():
+    assert solve_min_sum([[1, 1], [1, 1]], [1, 2]) is None
+    assert solve_min_sum([[2]], [3]) is None
+
+
+def test_negative_coefficients_need_bounds():
+    with pytest.raises(ValueError):
+        solve_min_sum([[1, -1]], [0])
+    solution = solve_min_sum([[1, -1]], [2], upper=[5, 5])
+    assert solution == [2, 0]
+
+
+def test_matches_brute_force():
+    rng = random.Random(21)
+    for _ in range(150):
+        rows, cols = rng.randint(1, 4), rng.randint(1, 4)
+        matrix = [[int(rng.random() < 0.5) for _ in range(cols)] for _ in range(rows)]
+        x = [rng.randint(0, 3) for _ in range(cols)]
+        target = [sum(a * v for a, v in zip(row, x)) for row in matrix]
+        if rng.random() < 0.2:
+            target[0] += 1
+        bound = max(target, default=0)
+        expected = _brute_force(matrix, target, bound)
+        solution = solve_min_sum(matrix, target)
+        if expected is None:
+            assert solution is None
+        else:
+            _check(matrix, target, solution)
+            assert sum(solution) == expected
@@ -0,0 +1,46 @@
+"""Tests for utils.intervals."""
+
+import random
+
+import pytest
+
+from utils.intervals import IntervalSet
+
+
+def _members(intervals):
+    return {v for start, end in intervals for v in range(start, end + 1)}
+
+
+def test_merges_overlapping_and_adjacent():
+    s = IntervalSet([(10, 14), (3, 5), (16, 20), (12, 18), (6, 6)])
+    assert list(s) == [(3, 6), (10, 20)]
+    assert len(s) == 2
+    assert s.total_length == 15
+
+
+def test_membership():
+    s = IntervalSet([(3, 5), (10, 14)])
+    assert [v for v in range(0, 16) if v in s] == [3, 4, 5, 10, 11, 12, 13, 14]
+    assert s.contains_many(range(0, 16)).tolist() == [v in s for v in range(0, 16)]
+    assert IntervalSet().contains_many([1, 2]).tolist() == [False, False]
+
+
+def test_from_text():
+    assert list(IntervalSet.from_text("3-5\n10-14\n\n1\n")) == [(3, 5), (10, 14)]
+    assert list(IntervalSet.from_text("11-22,95-115,998-1012")) == [(11, 22), (95, 115), (998, 1012)]
+
+
+def test_rejects_reversed_interval():
+    with pytest.raises(ValueError):
+        IntervalSet([(5, 3)])
+
+
+def test_set_operations_match_brute_force():
+    rng = random.Random(2025)
+    for _ in range(300):
+        a = [tuple(sorted(rng.choices(range(40), k=2))) for _ in range(rng.randint(0, 5))]
+        b = [tuple(sorted(rng.choices(range(40), k=2))) for _ in range(rng.randint(0, 5))]
+        left, right = IntervalSet(a), IntervalSet(b)
+        assert _members(left | right) == _members(a) | _members(b)
+        assert _members(left & right) == _members(a) & _members(b)
+        assert left | right == IntervalSet(a + b)
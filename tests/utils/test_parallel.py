@@ -0,0 +1,69 @@
+"""Tests for utils.parallel."""
+
+import subprocess
+import sys
+
+import pytest
+
+from utils import parallel
+from utils.parallel import close_pool, current_best, parallel_map, parallel_max, shared
+
+
+@pytest.fixture(autouse=True)
+def _no_leftover_pool():
+    yield
+    close_pool()
+
+
+def _square(x):
+    return x * x
+
+
+def _offset(x):
+    return x + shared()["offset"]
+
+
+def _pruned_value(x):
+    # Items that cannot beat the best so far are skipped, as a solution would
+    if x <= current_best():
+        return 0
+    return x
+
+
+def test_import_has_no_side_effects():
+    # In a fresh interpreter, importing allocates no shared memory and starts no pool
+    code = (
+        "import multiprocessing.heap as heap, utils.parallel as p\n"
+        "assert not heap.BufferWrapper._heap._arenas\n"
+        "assert p._best is None and p._pool is None and not p._exit_hook_registered\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_map_keeps_order(workers):
+    assert parallel_map(_square, range(50), workers=workers, chunksize=3) == [x * x for x in range(50)]
+
+
+def test_parallel_map_unordered_and_shared():
+    results = parallel_map(_offset, range(20), shared={"offset": 100}, workers=2, ordered=False)
+    assert sorted(results) == list(range(100, 120))
+    assert shared() is None
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_max(workers):
+    items = [5, 3, 17, 2, 11, 17, 4] * 5
+    assert parallel_max(_pruned_value, items, workers=workers, chunksize=2) == 17
+    assert parallel_max(_pruned_value, items, initial=20, workers=workers) == 20
+    assert parallel_max(_pruned_value, [], initial=7, workers=workers) == 7
+    assert parallel._best is None
+
+
+def test_pool_is_reused_and_restarted_for_other_worker_counts():
+    parallel_map(_square, range(10), workers=2)
+    pool = parallel._pool
+    parallel_max(_pruned_value, range(10), workers=2)
+    assert parallel._pool is pool
+    parallel_map(_square, range(10), workers=3)
+    assert parallel._pool is not pool
@@ -0,0 +1,39 @@
+"""Tests for utils.schematics."""
+
+import pytest
+
+from utils.schematics import Schematic, parse_schematic, parse_schematics
+
+
+def test_parse_line():
+    schematic = parse_schematic("[.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}")
+    assert schematic == Schematic(
+        lights=0b0110,
+        size=4,
+        buttons=((3,), (1, 3), (2,), (2, 3), (0, 2), (0, 1)),
+        button_masks=(0b1000, 0b1010, 0b0100, 0b1100, 0b0101, 0b0011),
+        joltages=(3, 5, 4, 7),
+    )
+
+
+def test_light_order():
+    # Light i is bit i, so the leftmost light is the lowest bit
+    assert parse_schematic("[#...] (0) {1}").lights == 0b0001
+    assert parse_schematic("[...#] (0) {1}").lights == 0b1000
+
+
+def test_parse_schematics_skips_blank_lines():
+    text = "[#] (0) {1}\n\n[.#] (0,1) {2,3}\n"
+    assert [s.joltages for s in parse_schematics(text)] == [(1,), (2, 3)]
+
+
+@pytest.mark.parametrize("line", [
+    "",
+    "[.##.] (3) (1,3 {3,5}",
+    "[.##.] (3) (1,3)",
+    "[.#x.] (3) {3}",
+    "[.##.] (__import__('os')) {3}",
+])
+def test_rejects_malformed_lines(line):
+    with pytest.raises(ValueError):
+        parse_schematic(line)
@@ -0,0 +1,35 @@
+"""Tests for utils.spatial."""
+
+import itertools
+import random
+
+from utils.spatial import nearest_pairs
+
+
+def _sorted_pairs(points):
+    """Reference: every pair, sorted by (squared distance, i, j)."""
+    def key(pair):
+        i, j = pair
+        return sum((a - b) ** 2 for a, b in zip(points[i], points[j])), i, j
+
+    return sorted(itertools.combinations(range(len(points)), 2), key=key)
+
+
+def test_matches_full_sort_with_ties():
+    rng = random.Random(17)
+    for _ in range(20):
+        # A small coordinate range makes equal distances common
+        points = [tuple(rng.randrange(6) for _ in range(3)) for _ in range(rng.randint(2, 40))]
+        assert list(nearest_pairs(points, batch=7)) == _sorted_pairs(points)
+
+
+def test_stops_after_k_pairs():
+    rng = random.Random(8)
+    points = [tuple(rng.randrange(1000) for _ in range(3)) for _ in range(50)]
+    assert list(nearest_pairs(points, k=30)) == _sorted_pairs(points)[:30]
+    assert len(list(nearest_pairs(points, k=10**6))) == 50 * 49 // 2
+
+
+def test_too_few_points():
+    assert list(nearest_pairs([(1, 2, 3)])) == []
+    assert list(nearest_pairs([])) == []
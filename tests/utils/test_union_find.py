@@ -0,0 +1,41 @@
+"""Tests for utils.union_find."""
+
+import random
+
+from utils.union_find import UnionFind
+
+
+def test_union_and_components():
+    uf = UnionFind(6)
+    assert len(uf) == 6
+    assert uf.components == 6
+    assert uf.union(0, 1)
+    assert uf.union(2, 3)
+    assert uf.union(1, 3)
+    assert not uf.union(0, 2)
+    assert uf.connected(0, 3)
+    assert not uf.connected(0, 4)
+    assert uf.components == 3
+    assert uf.component_size(2) == 4
+    assert uf.component_sizes() == [4, 1, 1]
+
+
+def test_matches_set_merging():
+    rng = random.Random(16)
+    n = 60
+    uf = UnionFind(n)
+    groups = [{i} for i in range(n)]
+    for _ in range(80):
+        a, b = rng.randrange(n), rng.randrange(n)
+        merged = groups[a] is not groups[b]
+        assert uf.union(a, b) == merged
+        if merged:
+            union = groups[a] | groups[b]
+            for x in union:
+                groups[x] = union
+    distinct = {id(g): g for g in groups}.values()
+    assert uf.components == len(distinct)
+    assert uf.component_sizes() == sorted(map(len, distinct), reverse=True)
+    for _ in range(100):
+        a, b = rng.randrange(n), rng.randrange(n)
+        assert uf.connected(a, b) == (b in groups[a])
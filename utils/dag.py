@@ -0,0 +1,162 @@
+"""Directed acyclic graphs with interned node names and path counting by topological sweep."""
+
+from typing import Iterable, Mapping, Optional, Sequence
+
+
+class DAG:
+    """
+    A directed acyclic graph over named nodes, stored as CSR adjacency.
+
+    Node names are interned to consecutive ints, and the successors of
+    node v are targets[offsets[v]:offsets[v + 1]]. The topological order is
+    computed once with Kahn's algorithm, without recursion, so deep graphs
+    are fine.
+
+    Args:
+        adjacency: Successor names per node name; nodes that only appear as
+            successors are added without outgoing edges
+
+    Raises:
+        ValueError: If the graph has a cycle
+    """
+
+    def __init__(self, adjacency: Mapping[str, Iterable[str]]):
+        self.names: list[str] = []
+        self.index: dict[str, int] = {}
+        edges = [(self._intern(source), [self._intern(t) for t in targets]) for source, targets in adjacency.items()]
+
+        successors: list[list[int]] = [[] for _ in self.names]
+        for source, targets in edges:
+            successors[source].extend(targets)
+        self.offsets = [0]
+        self.targets: list[int] = []
+        for targets in successors:
+            self.targets.extend(targets)
+            self.offsets.append(len(self.targets))
+
+        self.order = self._topological_order()
+        self.position = [0] * len(self.names)
+        for i, v in enumerate(self.order):
+            self.position[v] = i
+
+    @classmethod
+    def from_text(cls, text: str) -> "DAG":
+        """
+        Build a graph from "node: successor successor ..." lines.
+
+        Args:
+            text: One line per node with outgoing edges
+
+        Returns:
+            The graph
+        """
+        adjacency: dict[str, list[str]] = {}
+        for line in text.splitlines():
+            if line.strip():
+                source, targets = line.split(":")
+                adjacency.setdefault(source.strip(), []).extend(targets.split())
+        return cls(adjacency)
+
+    def _intern(self, name: str) -> int:
+        if name not in self.index:
+            self.index[name] = len(self.names)
+            self.names.append(name)
+        return self.index[name]
+
+    def _topological_order(self) -> list[int]:
+        """Kahn's algorithm: repeatedly emit a node without remaining incoming edges."""
+        indegree = [0] * len(self.names)
+        for t in self.targets:
+            indegree[t] += 1
+        order = [v for v, d in enumerate(indegree) if d == 0]
+        for v in order:
+            for t in self.targets[self.offsets[v]:self.offsets[v + 1]]:
+                indegree[t] -= 1
+                if indegree[t] == 0:
+                    order.append(t)
+        if len(order) < len(self.names):
+            raise ValueError("Graph has a cycle")
+        return order
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def node(self, name: str) -> int:
+        """Interned id of a node name."""
+        if name not in self.index:
+            raise KeyError(f"Unknown node {name!r}")
+        return self.index[name]
+
+    def successors(self, name: str) -> list[str]:
+        """Names of the direct successors of a node."""
+        v = self.node(name)
+        return [self.names[t] for t in self.targets[self.offsets[v]:self.offsets[v + 1]]]
+
+    def count_paths(self, pairs: Iterable[tuple[str, str]]) -> dict[tuple[str, str], int]:
+        """
+        Number of distinct paths for many (source, destination) pairs in one sweep.
+
+        Every node carries one count per distinct source; walking the nodes in
+        topological order pushes each node's counts to its successors, so all
+        pairs cost a single pass over the edges (times the number of sources).
+        Counts are exact Python ints.
+
+        Args:
+            pairs: (source, destination) node names
+
+        Returns:
+            The path count per pair (1 when source equals destination)
+        """
+        pairs = list(pairs)
+        sources = list(dict.fromkeys(self.node(source) for source, _ in pairs))
+        column = {s: k for k, s in enumerate(sources)}
+
+        counts: list[Optional[list[int]]] = [None] * len(self.names)
+        for k, s in enumerate(sources):
+            counts[s] = counts[s] or [0] * len(sources)
+            counts[s][k] = 1
+
+        # Nothing before the earliest source can be reached
+        start = min((self.position[s] for s in sources), default=len(self.order))
+        for v in self.order[start:]:
+            current = counts[v]
+            if current is None:
+                continue
+            for t in self.targets[self.offsets[v]:self.offsets[v + 1]]:
+                if counts[t] is None:
+                    counts[t] = current[:]
+                else:
+                    counts[t] = [a + b for a, b in zip(counts[t], current)]
+
+        result = {}
+        for source, destination in pairs:
+            reached = counts[self.node(destination)]
+            result[(source, destination)] = reached[column[self.node(source)]] if reached else 0
+        return result
+
+    def count_paths_via(self, source: str, destination: str, waypoints: Sequence[str] = ()) -> int:
+        """
+        Number of paths from source to destination that visit every waypoint.
+
+        In a DAG a path can only meet the waypoints in topological order, so
+        the count is the product of the path counts between consecutive
+        waypoints in that order, all taken from one count_paths sweep.
+
+        Args:
+            source: Start node name
+            destination: End node name
+            waypoints: Node names every counted path must pass through
+
+        Returns:
+            The number of such paths
+        """
+        stops = sorted(waypoints, key=lambda name: self.position[self.node(name)])
+        legs = list(zip([source, *stops], [*stops, destination]))
+        counts = self.count_paths(legs)
+        total = 1
+        for leg in legs:
+            total *= counts[leg]
+        return total
@@ -0,0 +1,107 @@
+"""Arithmetic enumeration of numbers whose digits are one block repeated (e.g. 1212, 777)."""
+
+from typing import Iterator, Optional
+
+
+def _mobius(n: int) -> int:
+    """Möbius function μ(n): 0 if n has a squared prime factor, else (-1)^(number of prime factors)."""
+    result = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    return -result if n > 1 else result
+
+
+def _repeat_factor(length: int, block_length: int) -> int:
+    """R such that block * R writes a block_length-digit block repeated up to length digits (e.g. 10101)."""
+    return (10**length - 1) // (10**block_length - 1)
+
+
+def _block_range(lo: int, hi: int, length: int, block_length: int) -> tuple[int, int, int]:
+    """Smallest and largest block whose repetition has length digits and lies in [lo, hi], and the factor R."""
+    factor = _repeat_factor(length, block_length)
+    lo = max(lo, 10 ** (length - 1))
+    hi = min(hi, 10**length - 1)
+    first = max(10 ** (block_length - 1), -(-lo // factor))
+    last = min(10**block_length - 1, hi // factor)
+    return first, last, factor
+
+
+def _periodic_sum(lo: int, hi: int, length: int, block_length: int) -> int:
+    """Sum of the length-digit numbers in [lo, hi] made of a block_length-digit block repeated (O(1))."""
+    first, last, factor = _block_range(lo, hi, length, block_length)
+    if first > last:
+        return 0
+    return factor * (first + last) * (last - first + 1) // 2
+
+
+def _lengths(lo: int, hi: int) -> range:
+    return range(len(str(max(lo, 1))), len(str(hi)) + 1)
+
+
+def sum_repeated(lo: int, hi: int, repeats: Optional[int] = None) -> int:
+    """
+    Sum of the numbers in [lo, hi] that consist of one digit block repeated.
+
+    With repeats=None a number counts once if it is any block repeated at
+    least twice (1111 is 1 x4 and 11 x2, but counted once). For a length L,
+    let S(q) be the sum of the L-digit numbers with a repeating block of q
+    digits. Numbers with a block of q digits also repeat every multiple of q,
+    so by Möbius inversion over the divisors of L the union of all proper
+    blocks sums to -Σ μ(L/q) S(q) over the divisors q < L. Every S(q) is an
+    arithmetic series, so the cost depends on the number of digits only,
+    not on the width of the range.
+
+    Args:
+        lo: Lower bound (inclusive)
+        hi: Upper bound (inclusive)
+        repeats: Count only numbers made of exactly this many copies of a block
+
+    Returns:
+        The sum of the matching numbers
+    """
+    total = 0
+    for length in _lengths(lo, hi):
+        if repeats is not None:
+            if length % repeats == 0:
+                total += _periodic_sum(lo, hi, length, length // repeats)
+            continue
+        for block_length in range(1, length // 2 + 1):
+            if length % block_length == 0:
+                total -= _mobius(length // block_length) * _periodic_sum(lo, hi, length, block_length)
+    return total
+
+
+def iter_repeated(lo: int, hi: int, repeats: Optional[int] = None) -> Iterator[int]:
+    """
+    Yield the numbers in [lo, hi] that consist of one digit block repeated, in increasing order.
+
+    Only the matching numbers are generated (block * R for every block in
+    range), so the cost follows the number of results, not the width of
+    the range.
+
+    Args:
+        lo: Lower bound (inclusive)
+        hi: Upper bound (inclusive)
+        repeats: Only numbers made of exactly this many copies of a block
+            (None for at least two copies)
+
+    Yields:
+        The matching numbers, each once
+    """
+    for length in _lengths(lo, hi):
+        if repeats is not None:
+            block_lengths = [length // repeats] if length % repeats == 0 else []
+        else:
+            block_lengths = [k for k in range(1, length // 2 + 1) if length % k == 0]
+
+        numbers = set()
+        for block_length in block_lengths:
+            first, last, factor = _block_range(lo, hi, length, block_length)
+            numbers.update(block * factor for block in range(first, last + 1))
+        yield from sorted(numbers)
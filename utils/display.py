@@ -1,7 +1,17 @@
 """Display and output utilities."""
 
-from rich.console import Console
+from typing import TYPE_CHECKING
+
+from rich.console import Console, Group
 from rich.panel import Panel
+from rich.table import Table
+
+if TYPE_CHECKING:
+    from core.benchmark import BenchmarkResult
+    from core.history import Comparison
+    from core.memory import MemoryProfile
+    from core.profiler import ProfileResult
+    from core.trace import Tracer
 
 console = Console()
 
@@ -36,3 +46,209 @@ def display_result(
     console.print("\n")
     console.print(result_panel)
     console.print("\n")
+
+
+def format_duration(seconds: float) -> str:
+    """Format a duration with a unit that keeps it readable (s, ms or µs)."""
+    if seconds >= 1:
+        return f"{seconds:.4f}s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f}ms"
+    return f"{seconds * 1e6:.1f}µs"
+
+
+def format_bytes(size: float) -> str:
+    """Format a byte count with a binary unit (B, KiB, MiB, GiB)."""
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GiB"
+
+
+def display_benchmark(
+    result: "BenchmarkResult",
+    year: int,
+    day: int,
+    part: str,
+) -> None:
+    """
+    Display a formatted benchmark panel with timing statistics.
+
+    Args:
+        result: The benchmark result to display
+        year: The year of the puzzle
+        day: The day of the puzzle
+        part: The part of the puzzle
+    """
+    stats = Table.grid(padding=(0, 2))
+    stats.add_column(style="cyan")
+    stats.add_column(justify="right")
+    stats.add_row("Answer", f"[green bold]{result.answer}[/green bold]")
+    stats.add_row("min", format_duration(result.min))
+    stats.add_row("median", format_duration(result.median))
+    stats.add_row("p95", format_duration(result.p95))
+    stats.add_row("stddev", format_duration(result.stddev))
+
+    result_panel = Panel(
+        stats,
+        title=f"[yellow]Benchmark - Year {year}, Day {day}, Part {part.upper()}[/yellow]",
+        subtitle=(
+            f"[dim]{result.runs} run(s) after {result.warmup} warmup, "
+            f"{result.outliers} outlier(s) rejected[/dim]"
+        ),
+        border_style="green"
+    )
+    console.print("\n")
+    console.print(result_panel)
+    console.print("\n")
+
+
+def display_comparison(comparisons: list["Comparison"], threshold: float) -> None:
+    """
+    Display median runtimes against their baseline, highlighting regressions.
+
+    Args:
+        comparisons: Per-part comparisons against the baseline
+        threshold: Relative slowdown above which a part counts as regressed
+    """
+    if not comparisons:
+        console.print("[yellow]No baseline found in the benchmark history to compare against[/yellow]")
+        return
+
+    table = Table(title=f"Comparison against baseline (threshold +{threshold:.0%})")
+    table.add_column("Puzzle", style="cyan")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("Baseline commit", style="dim")
+
+    for c in comparisons:
+        change = f"{c.ratio - 1:+.1%}"
+        if c.is_regression(threshold):
+            change = f"[red bold]{change} ▲[/red bold]"
+        elif c.ratio < 1 - threshold:
+            change = f"[green]{change} ▼[/green]"
+        table.add_row(
+            f"{c.year}/{c.day:02d}{c.part}",
+            format_duration(c.baseline),
+            format_duration(c.current),
+            change,
+            c.baseline_commit,
+        )
+    console.print(table)
+
+
+def display_trace(tracer: "Tracer", width: int = 20) -> None:
+    """
+    Display recorded spans as a waterfall, one bar per phase.
+
+    Args:
+        tracer: The tracer holding the spans
+        width: Width of the waterfall column in characters
+    """
+    spans = tracer.ordered()
+    if not spans:
+        return
+    total = tracer.total() or 1e-9
+
+    table = Table(title="Trace", caption=f"Total: {format_duration(tracer.total())}")
+    table.add_column("Phase", style="cyan", no_wrap=True)
+    table.add_column("Start", justify="right", style="dim", no_wrap=True)
+    table.add_column("Duration", justify="right", no_wrap=True)
+    table.add_column("Waterfall", min_width=width, no_wrap=True)
+
+    for s in spans:
+        offset = int((s.start - tracer.origin) / total * width)
+        length = max(1, round(s.duration / total * width))
+        bar = " " * offset + "█" * min(length, width - offset)
+        table.add_row(
+            "  " * s.depth + s.name,
+            format_duration(s.start - tracer.origin),
+            format_duration(s.duration),
+            f"[magenta]{bar}[/magenta]",
+        )
+    console.print(table)
+
+
+def display_memory(
+    profile: "MemoryProfile",
+    year: int,
+    day: int,
+    part: str,
+) -> None:
+    """
+    Display a memory profile: answer, peak memory figures and the lines holding the most memory.
+
+    Args:
+        profile: The memory profile to display
+        year: The year of the puzzle
+        day: The day of the puzzle
+        part: The part of the puzzle
+    """
+    stats = Table.grid(padding=(0, 2))
+    stats.add_column(style="cyan")
+    stats.add_column(justify="right")
+    stats.add_row("Answer", f"[green bold]{profile.answer}[/green bold]")
+    stats.add_row("Peak traced memory", format_bytes(profile.peak_traced))
+    stats.add_row("Live block growth", f"{profile.block_growth:+,}")
+    if profile.rss_peak is not None:
+        stats.add_row("Peak RSS", format_bytes(profile.rss_peak))
+        stats.add_row("RSS growth", format_bytes(profile.rss_growth))
+
+    sites = Table(title="Lines holding the most memory (at peak)", expand=True)
+    sites.add_column("Line", style="cyan", overflow="fold")
+    sites.add_column("Size growth", justify="right")
+    sites.add_column("Live block growth", justify="right")
+    for site in profile.top_sites:
+        sites.add_row(site.location, format_bytes(site.size), f"{site.block_growth:+,}")
+
+    result_panel = Panel(
+        Group(stats, "", sites),
+        title=f"[yellow]Memory - Year {year}, Day {day}, Part {part.upper()}[/yellow]",
+        subtitle=f"[dim]⏱️  Completed in {profile.elapsed:.4f}s (under tracemalloc)[/dim]",
+        border_style="green"
+    )
+    console.print("\n")
+    console.print(result_panel)
+    console.print("\n")
+
+
+def display_profile(
+    result: "ProfileResult",
+    year: int,
+    day: int,
+    part: str,
+) -> None:
+    """
+    Display a profile: answer, the hottest functions and the written profile files.
+
+    Args:
+        result: The profile result to display
+        year: The year of the puzzle
+        day: The day of the puzzle
+        part: The part of the puzzle
+    """
+    functions = Table(title=f"Top {len(result.entries)} functions by own time ({result.mode.value})", expand=True)
+    functions.add_column("Function", style="cyan", overflow="fold")
+    functions.add_column("Calls", justify="right")
+    functions.add_column("Own", justify="right")
+    functions.add_column("Total", justify="right")
+    for entry in result.entries:
+        functions.add_row(
+            entry.function,
+            f"{entry.calls:,}" if entry.calls is not None else "-",
+            format_duration(entry.self_time),
+            format_duration(entry.total_time),
+        )
+
+    files = "\n".join(f"[dim]📄 {path}[/dim]" for path in result.files)
+    result_panel = Panel(
+        Group(f"[green bold]{result.answer}[/green bold]", "", functions, "", files),
+        title=f"[yellow]Profile - Year {year}, Day {day}, Part {part.upper()}[/yellow]",
+        subtitle=f"[dim]⏱️  Completed in {result.elapsed:.4f}s (under {result.mode.value})[/dim]",
+        border_style="green"
+    )
+    console.print("\n")
+    console.print(result_panel)
+    console.print("\n")
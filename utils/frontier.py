@@ -0,0 +1,40 @@
+"""Worklist (frontier) simulation of repeated removal over a fixed neighbourhood graph."""
+
+from typing import Iterator
+
+import numpy as np
+
+
+def peel(alive: np.ndarray, neighbours: np.ndarray, min_neighbours: int) -> Iterator[np.ndarray]:
+    """
+    Repeatedly remove every alive node with fewer than min_neighbours alive neighbours.
+
+    Neighbour counts are computed once and then updated from the removed
+    nodes only; each round re-checks just the nodes next to a removal. The
+    work is proportional to the number of removals instead of rounds times
+    nodes. All nodes that qualify in a round are removed together, which ends
+    in the same state as removing them one at a time.
+
+    Args:
+        alive: Boolean array of the nodes that are initially present (not modified)
+        neighbours: (nodes, degree) array of neighbour indices; the index
+            len(alive) marks a missing neighbour and never counts as alive
+        min_neighbours: Nodes with fewer alive neighbours than this are removed
+
+    Yields:
+        The indices of the nodes removed in each round
+    """
+    n = len(alive)
+    # One extra, never alive, slot for the missing-neighbour index
+    alive = np.append(alive, False)
+    counts = alive[neighbours].sum(axis=1, dtype=np.int64)
+    counts = np.append(counts, 0)
+
+    frontier = np.flatnonzero(alive[:n] & (counts[:n] < min_neighbours))
+    while frontier.size:
+        alive[frontier] = False
+        yield frontier
+
+        touched = neighbours[frontier].ravel()
+        np.subtract.at(counts, touched, 1)
+        frontier = np.unique(touched[alive[touched] & (counts[touched] < min_neighbours)])
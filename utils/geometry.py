@@ -0,0 +1,122 @@
+"""Axis-aligned (rectilinear) polygons on the integer grid."""
+
+from bisect import bisect_left
+from typing import Sequence
+
+import numpy as np
+
+
+class RectilinearPolygon:
+    """
+    A simple polygon whose edges are horizontal or vertical, including its boundary.
+
+    The plane is coordinate-compressed: every distinct vertex x (and y) gets a
+    column (row) of its own, and so does every gap between two consecutive
+    ones, plus the gaps before the first and after the last. Each compressed
+    cell is therefore either entirely inside or entirely outside the polygon.
+    The inside mask is computed with a vectorized even-odd scan, and a 2D
+    prefix sum over it answers rectangle containment in O(1).
+
+    Containment is about integer tiles: a gap between consecutive coordinates
+    that differ by 1 holds no tiles, so its cells count as inside even where
+    the continuous polygon has a zero-width notch there.
+
+    Args:
+        vertices: (x, y) corners in order around the polygon; consecutive
+            corners (and the last and first) must share an x or a y
+    """
+
+    def __init__(self, vertices: Sequence[tuple[int, int]]):
+        self.vertices = [tuple(v) for v in vertices]
+        self.xs = sorted({x for x, _ in self.vertices})
+        self.ys = sorted({y for _, y in self.vertices})
+        self.shape = (2 * len(self.ys) + 1, 2 * len(self.xs) + 1)
+
+        boundary = np.zeros(self.shape, dtype=bool)
+        # +1 where a vertical edge crosses the (gap) row at that column
+        crossings = np.zeros(self.shape, dtype=np.int32)
+        for (x0, y0), (x1, y1) in zip(self.vertices, self.vertices[1:] + self.vertices[:1]):
+            if x0 != x1 and y0 != y1:
+                raise ValueError(f"Edge {(x0, y0)} -> {(x1, y1)} is not axis-aligned")
+            c0, c1 = sorted((self._column(x0), self._column(x1)))
+            r0, r1 = sorted((self._row(y0), self._row(y1)))
+            boundary[r0:r1 + 1, c0:c1 + 1] = True
+            if c0 == c1:
+                crossings[r0 + 1:r1, c0] = 1
+
+        # Even-odd rule along the gap rows; a vertex row cell that is not on the
+        # boundary is inside exactly when the gap row above it is
+        inside = np.cumsum(crossings, axis=1) % 2 == 1
+        inside[1::2] = inside[0:-1:2]
+        inside |= boundary
+        inside[:, self._empty_gaps(self.xs)] = True
+        inside[self._empty_gaps(self.ys), :] = True
+        self.inside = inside
+
+        self._prefix = np.zeros((self.shape[0] + 1, self.shape[1] + 1), dtype=np.int64)
+        self._prefix[1:, 1:] = inside.cumsum(axis=0).cumsum(axis=1)
+
+    @staticmethod
+    def _empty_gaps(coords: list[int]) -> np.ndarray:
+        """Compressed indices of the gaps between consecutive coordinates that contain no integer."""
+        steps = np.diff(np.asarray(coords, dtype=np.int64))
+        return 2 * (np.flatnonzero(steps == 1) + 1)
+
+    def _column(self, x: int) -> int:
+        """Compressed column of an x coordinate: odd for vertex xs, even for the gaps between them."""
+        i = bisect_left(self.xs, x)
+        return 2 * i + 1 if i < len(self.xs) and self.xs[i] == x else 2 * i
+
+    def _row(self, y: int) -> int:
+        """Compressed row of a y coordinate: odd for vertex ys, even for the gaps between them."""
+        i = bisect_left(self.ys, y)
+        return 2 * i + 1 if i < len(self.ys) and self.ys[i] == y else 2 * i
+
+    @staticmethod
+    def _compress(values: np.ndarray, coords: list[int]) -> np.ndarray:
+        """Vectorized _column/_row."""
+        sorted_coords = np.asarray(coords)
+        i = np.searchsorted(sorted_coords, values)
+        exact = (i < len(coords)) & (sorted_coords[np.minimum(i, len(coords) - 1)] == values)
+        return 2 * i + exact
+
+    def __contains__(self, point: tuple[int, int]) -> bool:
+        x, y = point
+        return bool(self.inside[self._row(y), self._column(x)])
+
+    def contains_rect(self, corner: tuple[int, int], opposite: tuple[int, int]) -> bool:
+        """
+        Whether the axis-aligned rectangle spanned by two corners lies fully inside.
+
+        Args:
+            corner: One corner (x, y)
+            opposite: The diagonally opposite corner
+
+        Returns:
+            True if every point of the rectangle is inside or on the boundary
+        """
+        c0, c1 = sorted((self._column(corner[0]), self._column(opposite[0])))
+        r0, r1 = sorted((self._row(corner[1]), self._row(opposite[1])))
+        p = self._prefix
+        inside = p[r1 + 1, c1 + 1] - p[r0, c1 + 1] - p[r1 + 1, c0] + p[r0, c0]
+        return int(inside) == (r1 - r0 + 1) * (c1 - c0 + 1)
+
+    def contains_rects(self, corners: np.ndarray, opposites: np.ndarray) -> np.ndarray:
+        """
+        Vectorized contains_rect for many rectangles at once.
+
+        Args:
+            corners: (n, 2) array of (x, y) corners
+            opposites: (n, 2) array of the diagonally opposite corners
+
+        Returns:
+            A bool array of length n
+        """
+        corners, opposites = np.asarray(corners), np.asarray(opposites)
+        ca, cb = self._compress(corners[:, 0], self.xs), self._compress(opposites[:, 0], self.xs)
+        ra, rb = self._compress(corners[:, 1], self.ys), self._compress(opposites[:, 1], self.ys)
+        c0, c1 = np.minimum(ca, cb), np.maximum(ca, cb)
+        r0, r1 = np.minimum(ra, rb), np.maximum(ra, rb)
+        p = self._prefix
+        inside = p[r1 + 1, c1 + 1] - p[r0, c1 + 1] - p[r1 + 1, c0] + p[r0, c0]
+        return inside == (r1 - r0 + 1) * (c1 - c0 + 1)
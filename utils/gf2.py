@@ -0,0 +1,97 @@
+"""Linear algebra over GF(2) on integer bitmasks (XOR systems such as toggling lights)."""
+
+from typing import Optional, Sequence
+
+
+def solution_space(columns: Sequence[int], target: int) -> Optional[tuple[int, list[int]]]:
+    """
+    All solutions of the XOR system "columns selected by x XOR together to target".
+
+    Column i is a bitmask of the equations (e.g. lights) it flips, and x is
+    a bitmask over the columns (e.g. the buttons pressed). Gauss-Jordan
+    elimination runs on one integer per equation, so each row operation is a
+    single XOR.
+
+    Args:
+        columns: Bitmask of the equations each variable flips
+        target: Bitmask of the equations that must end up flipped
+
+    Returns:
+        (particular, basis) such that the solutions are exactly particular
+        XOR any combination of the null space basis vectors, or None if there
+        is no solution
+    """
+    n = len(columns)
+    m = max((c.bit_length() for c in columns), default=0)
+    if target >> m:
+        # The target flips an equation no column touches
+        return None
+
+    # Row j: bitmask of the variables that flip equation j, right-hand side bit in position n
+    rows = []
+    for j in range(m):
+        row = sum(1 << i for i, c in enumerate(columns) if c >> j & 1)
+        rows.append(row | (target >> j & 1) << n)
+
+    pivots = []
+    r = 0
+    for i in range(n):
+        pivot = next((k for k in range(r, m) if rows[k] >> i & 1), None)
+        if pivot is None:
+            continue
+        rows[r], rows[pivot] = rows[pivot], rows[r]
+        for k in range(m):
+            if k != r and rows[k] >> i & 1:
+                rows[k] ^= rows[r]
+        pivots.append(i)
+        r += 1
+
+    # A remaining row 0 = 1 has no solution
+    if any(rows[k] for k in range(r, m)):
+        return None
+
+    particular = 0
+    for row, p in zip(rows, pivots):
+        if row >> n & 1:
+            particular |= 1 << p
+
+    pivot_set = set(pivots)
+    basis = []
+    for f in range(n):
+        if f in pivot_set:
+            continue
+        # Setting free variable f flips every pivot whose row contains f
+        vector = 1 << f
+        for row, p in zip(rows, pivots):
+            if row >> f & 1:
+                vector |= 1 << p
+        basis.append(vector)
+    return particular, basis
+
+
+def min_weight_solution(columns: Sequence[int], target: int) -> Optional[int]:
+    """
+    A solution of the XOR system with the fewest variables set.
+
+    Walks all 2^nullity cosets in Gray code order, so each step is one XOR
+    and a popcount. The cost grows with the nullity of the system rather than
+    with 2^len(columns).
+
+    Args:
+        columns: Bitmask of the equations each variable flips
+        target: Bitmask of the equations that must end up flipped
+
+    Returns:
+        The bitmask of the selected variables, or None if there is no solution
+    """
+    space = solution_space(columns, target)
+    if space is None:
+        return None
+    x, basis = space
+    best = x
+    for step in range(1, 1 << len(basis)):
+        # The Gray code changes in the position of the lowest set bit of step
+        x ^= basis[(step & -step).bit_length() - 1]
+        if x.bit_count() < best.bit_count():
+            best = x
+    return best
@@ -0,0 +1,271 @@
+"""NumPy-backed 2D character grids for grid puzzles."""
+
+from collections import deque
+from typing import Iterator
+
+import numpy as np
+
+from utils.frontier import peel
+
+# (row, column) steps to the 8 neighbours of a cell
+NEIGHBOURS_8 = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+# (row, column) steps to the 4 orthogonal neighbours of a cell
+NEIGHBOURS_4 = [(-1, 0), (0, -1), (0, 1), (1, 0)]
+
+
+def parse_grid(input: str, fill: str = " ") -> np.ndarray:
+    """
+    Parse a block of text lines into a 2D array of ASCII codes.
+
+    Args:
+        input: The puzzle input, one grid row per line
+        fill: Character used to pad lines shorter than the longest one
+
+    Returns:
+        A (rows, columns) uint8 array; compare against ord(char) or use cells()
+    """
+    lines = input.splitlines()
+    width = max(map(len, lines), default=0)
+    data = "".join(line.ljust(width, fill) for line in lines).encode("ascii")
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(lines), width).copy()
+
+
+def cells(grid: np.ndarray, chars: str) -> np.ndarray:
+    """
+    Boolean mask of the cells holding any of the given characters.
+
+    Args:
+        grid: Grid as returned by parse_grid
+        chars: The characters to look for
+
+    Returns:
+        A bool array with the shape of the grid
+    """
+    return np.isin(grid, np.frombuffer(chars.encode("ascii"), dtype=np.uint8))
+
+
+def find(grid: np.ndarray, char: str) -> tuple[int, int]:
+    """
+    Position of the first occurrence of a character (row-major order).
+
+    Args:
+        grid: Grid as returned by parse_grid
+        char: The character to look for
+
+    Returns:
+        Its (row, column)
+    """
+    matches = np.argwhere(grid == ord(char))
+    if len(matches) == 0:
+        raise ValueError(f"{char!r} not found in grid")
+    return int(matches[0][0]), int(matches[0][1])
+
+
+def _shifted(padded: np.ndarray, shape: tuple[int, int], dr: int, dc: int, margin: int) -> np.ndarray:
+    """View of a padded array, moved so index (r, c) reads the original cell (r + dr, c + dc)."""
+    rows, cols = shape
+    return padded[margin + dr:margin + dr + rows, margin + dc:margin + dc + cols]
+
+
+def neighbour_counts(mask: np.ndarray, diagonal: bool = True) -> np.ndarray:
+    """
+    For every cell, the number of neighbouring cells set in a mask.
+
+    A 3x3 (or plus-shaped) convolution written as a sum of shifted views, so
+    it needs nothing beyond NumPy. Cells outside the grid count as unset.
+
+    Args:
+        mask: Boolean grid mask
+        diagonal: Count all 8 neighbours (True) or only the 4 orthogonal ones
+
+    Returns:
+        A uint8 array with the shape of the mask
+    """
+    padded = np.pad(mask.astype(np.uint8), 1)
+    counts = np.zeros(mask.shape, dtype=np.uint8)
+    for dr, dc in NEIGHBOURS_8 if diagonal else NEIGHBOURS_4:
+        counts += _shifted(padded, mask.shape, dr, dc, 1)
+    return counts
+
+
+def neighbour_table(shape: tuple[int, int], diagonal: bool = True) -> np.ndarray:
+    """
+    Flat (row-major) indices of the neighbours of every cell, for utils.frontier.
+
+    Args:
+        shape: (rows, columns) of the grid
+        diagonal: Include all 8 neighbours (True) or only the 4 orthogonal ones
+
+    Returns:
+        A (rows * columns, 8 or 4) int32 array; neighbours outside the grid
+        get the index rows * columns
+    """
+    rows, cols = shape
+    missing = rows * cols
+    # Pad the index grid with the missing-neighbour index, then read it shifted
+    padded = np.pad(np.arange(missing, dtype=np.int32).reshape(shape), 1, constant_values=missing)
+    steps = NEIGHBOURS_8 if diagonal else NEIGHBOURS_4
+    table = np.empty((rows, cols, len(steps)), dtype=np.int32)
+    for k, (dr, dc) in enumerate(steps):
+        table[:, :, k] = _shifted(padded, shape, dr, dc, 1)
+    return table.reshape(missing, len(steps))
+
+
+def erode(mask: np.ndarray, min_neighbours: int, diagonal: bool = True) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Repeatedly clear every set cell with fewer than min_neighbours set neighbours.
+
+    Each round removes all such cells at once, until none are left. Only the
+    neighbours of the cells removed in a round are re-checked in the next
+    (see utils.frontier.peel), so the cost follows the number of removals.
+
+    Args:
+        mask: Boolean grid mask (not modified)
+        min_neighbours: Cells with fewer set neighbours than this are removed
+        diagonal: Count all 8 neighbours (True) or only the 4 orthogonal ones
+
+    Yields:
+        (rows, columns) index arrays of the cells removed in each round
+    """
+    for removed in peel(mask.ravel(), neighbour_table(mask.shape, diagonal), min_neighbours):
+        yield np.unravel_index(removed, mask.shape)
+
+
+def _unshadowed(reached: np.ndarray) -> np.ndarray:
+    """
+    The splitters that split when each splitter's right-hand beam covers its right neighbour.
+
+    Within a run of side-by-side reached splitters, the first splits, the
+    second is covered by its beam and lets its own beam through, the third
+    splits again, and so on: every other one from the start of the run.
+    """
+    columns = np.arange(len(reached))
+    run_starts = reached & ~np.concatenate(([False], reached[:-1]))
+    start_of_run = np.maximum.accumulate(np.where(run_starts, columns, 0))
+    return reached & ((columns - start_of_run) % 2 == 0)
+
+
+def flow_down(
+    splitters: np.ndarray,
+    start: tuple[int, int],
+    dtype: type = np.int64,
+    shadow: bool = False,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Sweep beams down a grid row by row, splitting them left and right at splitters.
+
+    A beam that enters a splitter cell leaves the row in the columns to its
+    left and right instead; beams leaving the grid sideways are dropped. The
+    state is one vector of beam counts (the number of distinct paths) per
+    column, and a splitter row is two shifted adds, so there is no recursion
+    and no per-cell bookkeeping.
+
+    Args:
+        splitters: Boolean grid mask of the splitter cells
+        start: (row, column) the beam enters from; it moves down into the next row
+        dtype: Count type; int64 by default, pass object for exact Python ints
+            when the number of paths can exceed 2^63
+        shadow: Scan each row left to right, so the right-hand beam of a
+            splitter covers a reached splitter directly to its right, which
+            then lets its beam pass instead of splitting. Without it, every
+            reached splitter splits. The two only differ for side-by-side
+            splitters.
+
+    Yields:
+        For every row below the start: (split, counts), the mask of the
+        splitters that split a beam in that row and the beam counts leaving it
+    """
+    row, column = start
+    counts = np.zeros(splitters.shape[1], dtype=dtype)
+    counts[column] = 1
+    for splitter_row in splitters[row + 1:]:
+        splitting = splitter_row & (counts > 0)
+        if shadow:
+            splitting = _unshadowed(splitting)
+        split = np.where(splitting, counts, 0)
+        counts = np.where(splitting, 0, counts).astype(dtype)
+        counts[:-1] += split[1:]
+        counts[1:] += split[:-1]
+        yield splitting, counts
+
+
+def flow_counts(splitters: np.ndarray, start: tuple[int, int], dtype: type = np.int64, shadow: bool = False) -> np.ndarray:
+    """
+    Beam counts per column leaving the bottom row of a flow_down sweep.
+
+    Args:
+        splitters: Boolean grid mask of the splitter cells
+        start: (row, column) the beam enters from
+        dtype: Count type, as for flow_down
+        shadow: Side-by-side splitter rule, as for flow_down
+
+    Returns:
+        The counts after the last row (just the start beam if it is on the last row)
+    """
+    # Keep only the last row of the sweep
+    last = deque(flow_down(splitters, start, dtype=dtype, shadow=shadow), maxlen=1)
+    if last:
+        return last[0][1]
+    counts = np.zeros(splitters.shape[1], dtype=dtype)
+    counts[start[1]] = 1
+    return counts
+
+
+def match_pattern(grid: np.ndarray, pattern: list[str], wildcard: str = ".") -> np.ndarray:
+    """
+    Find every placement of a rectangular pattern in the grid.
+
+    Args:
+        grid: Grid as returned by parse_grid
+        pattern: Equally long rows of the pattern
+        wildcard: Pattern character that matches any cell
+
+    Returns:
+        A bool array, True at the top-left corner of every match
+    """
+    height, width = len(pattern), len(pattern[0])
+    rows, cols = grid.shape[0] - height + 1, grid.shape[1] - width + 1
+    matches = np.ones((max(rows, 0), max(cols, 0)), dtype=bool)
+    for i, row in enumerate(pattern):
+        for j, char in enumerate(row):
+            if char != wildcard:
+                matches &= grid[i:i + rows, j:j + cols] == ord(char)
+    return matches
+
+
+def match_word(grid: np.ndarray, word: str, direction: tuple[int, int]) -> np.ndarray:
+    """
+    Find every occurrence of a word read in one direction (horizontal, vertical or diagonal).
+
+    Args:
+        grid: Grid as returned by parse_grid
+        word: The word to look for
+        direction: (row, column) step between consecutive letters, e.g. (1, 1) for ↘
+
+    Returns:
+        A bool array with the shape of the grid, True where the word starts
+    """
+    margin = len(word)
+    # Pad with 0, which never equals a letter, so words cannot run off the grid
+    padded = np.pad(grid, margin)
+    dr, dc = direction
+    matches = np.ones(grid.shape, dtype=bool)
+    for k, char in enumerate(word):
+        matches &= _shifted(padded, grid.shape, k * dr, k * dc, margin) == ord(char)
+    return matches
+
+
+def count_word(grid: np.ndarray, word: str, directions: list[tuple[int, int]] = NEIGHBOURS_8) -> int:
+    """
+    Count the occurrences of a word in the grid, in the given directions.
+
+    Args:
+        grid: Grid as returned by parse_grid
+        word: The word to look for
+        directions: (row, column) steps to read in; by default all 8, which
+            includes the word written backwards
+
+    Returns:
+        The number of occurrences
+    """
+    return sum(int(match_word(grid, word, direction).sum()) for direction in directions)
@@ -0,0 +1,190 @@
+"""Exact minimum-sum non-negative integer solutions of small linear equation systems."""
+
+from fractions import Fraction
+from math import lcm
+from typing import Optional, Sequence
+
+# Stand-in for "no upper bound" that keeps the bound arithmetic in integers
+_UNBOUNDED = 1 << 62
+
+
+def _rref(matrix: Sequence[Sequence[int]], target: Sequence[int]) -> Optional[tuple[list[list[Fraction]], list[int]]]:
+    """
+    Reduced row echelon form of the augmented matrix [matrix | target], in exact fractions.
+
+    Returns:
+        The non-zero rows and the pivot column of each, or None if the system is inconsistent
+    """
+    rows = [[Fraction(v) for v in row] + [Fraction(t)] for row, t in zip(matrix, target)]
+    n = len(matrix[0]) if matrix else 0
+    pivots = []
+    r = 0
+    for c in range(n):
+        pivot = next((i for i in range(r, len(rows)) if rows[i][c] != 0), None)
+        if pivot is None:
+            continue
+        rows[r], rows[pivot] = rows[pivot], rows[r]
+        scale = rows[r][c]
+        rows[r] = [v / scale for v in rows[r]]
+        for i in range(len(rows)):
+            if i != r and rows[i][c] != 0:
+                factor = rows[i][c]
+                rows[i] = [a - factor * b for a, b in zip(rows[i], rows[r])]
+        pivots.append(c)
+        r += 1
+
+    # A remaining row 0 = t with t != 0 has no solution
+    if any(row[-1] != 0 for row in rows[r:]):
+        return None
+    return rows[:r], pivots
+
+
+def solve_min_sum(
+    matrix: Sequence[Sequence[int]],
+    target: Sequence[int],
+    upper: Optional[Sequence[int]] = None,
+) -> Optional[list[int]]:
+    """
+    Minimise sum(x) subject to matrix @ x == target with x a vector of non-negative integers.
+
+    Gauss-Jordan elimination in exact fractions expresses every pivot
+    variable in the free variables, so only the free variables (the nullity
+    of the system, usually a handful) are searched. The search is a
+    depth-first walk over the free variables in which every level narrows
+    the range of its variable, so that all pivot variables can still be
+    non-negative, and cuts branches whose objective lower bound cannot beat
+    the best solution found so far. Everything runs in-process with integer
+    arithmetic in the inner loop.
+
+    Args:
+        matrix: Coefficients, one row per equation
+        target: Right-hand sides
+        upper: Upper bound per variable; when omitted it is derived from the
+            equations, which requires a non-negative matrix and target
+
+    Returns:
+        An optimal solution, or None if there is no non-negative integer
+        solution (the search has no node limit, so None is never a give-up)
+    """
+    n = len(matrix[0]) if matrix else 0
+    if upper is None:
+        if any(v < 0 for row in matrix for v in row) or any(t < 0 for t in target):
+            raise ValueError("Upper bounds are required for equations with negative coefficients")
+        # With everything non-negative, x_i * a_ji <= t_j for every equation j
+        upper = [
+            min((t // row[i] for row, t in zip(matrix, target) if row[i] > 0), default=0)
+            for i in range(n)
+        ]
+
+    reduced = _rref(matrix, target)
+    if reduced is None:
+        return None
+    rows, pivots = reduced
+    free = [c for c in range(n) if c not in set(pivots)]
+
+    # Scale each row to integers: d * x_pivot + sum(a_f * x_f) = e, so that
+    # x_pivot = (e - sum(a_f * x_f)) / d must be a non-negative integer within its bound
+    coeffs, rhs, scales = [], [], []
+    for row in rows:
+        scale = lcm(*(v.denominator for v in row))
+        coeffs.append([int(row[f] * scale) for f in free])
+        rhs.append(int(row[-1] * scale))
+        scales.append(scale)
+    pivot_max = [d * upper[p] for d, p in zip(scales, pivots)]
+
+    # Objective times L = lcm(d): sum(x) * L = sum(e * L / d) + sum(w_f * x_f)
+    big_l = lcm(*scales) if scales else 1
+    weights = [big_l - sum(a[k] * (big_l // d) for a, d in zip(coeffs, scales)) for k in range(len(free))]
+    base = sum(e * (big_l // d) for e, d in zip(rhs, scales))
+
+    best: list[Optional[int]] = [None]
+    best_values: list[int] = [0] * len(free)
+
+    def search(residuals: list[int], low: list[int], high: list[int], open_vars: list[int], objective: int, values: list[int]) -> None:
+        if best[0] is None:
+            low, high = _propagate(coeffs, residuals, pivot_max, low, high, open_vars)
+        else:
+            # Also require an objective below the best so far: sum(w_j * x_j) <= best - 1 - objective
+            low, high = _propagate(
+                coeffs + [weights], residuals + [best[0] - 1 - objective], pivot_max + [_UNBOUNDED], low, high, open_vars,
+            )
+        if low is None:
+            return
+        if not open_vars:
+            if all(r % d == 0 for r, d in zip(residuals, scales)):
+                best[0] = objective
+                best_values[:] = values
+            return
+
+        # Branch on the variable with the smallest range, best objective first
+        k = min(open_vars, key=lambda j: high[j] - low[j])
+        rest = [j for j in open_vars if j != k]
+        candidates = range(low[k], high[k] + 1) if weights[k] >= 0 else range(high[k], low[k] - 1, -1)
+        for x in candidates:
+            values[k] = x
+            new_residuals = [r - a[k] * x for r, a in zip(residuals, coeffs)]
+            fixed_low, fixed_high = low[:], high[:]
+            fixed_low[k] = fixed_high[k] = x
+            search(new_residuals, fixed_low, fixed_high, rest, objective + weights[k] * x, values)
+            if not rest and best[0] == objective + weights[k] * x:
+                # Last variable: later values only make the objective worse
+                return
+
+    search(rhs, [0] * len(free), [upper[f] for f in free], list(range(len(free))), base, [0] * len(free))
+    if best[0] is None:
+        return None
+
+    solution = [0] * n
+    for f, x in zip(free, best_values):
+        solution[f] = x
+    for p, a, e, d in zip(pivots, coeffs, rhs, scales):
+        solution[p] = (e - sum(c * x for c, x in zip(a, best_values))) // d
+    return solution
+
+
+def _propagate(
+    coeffs: list[list[int]],
+    residuals: list[int],
+    pivot_max: list[int],
+    low: list[int],
+    high: list[int],
+    open_vars: list[int],
+) -> tuple[Optional[list[int]], Optional[list[int]]]:
+    """
+    Tighten the free variable ranges until every pivot variable can stay within its bounds.
+
+    Each equation requires 0 <= residual - sum(a_j * x_j) <= pivot_max over the
+    open variables; the extremes of that sum over the current ranges bound
+    every single variable. Repeats until nothing changes.
+
+    Returns:
+        The tightened (low, high) ranges, or (None, None) if they became empty
+    """
+    changed = True
+    while changed:
+        changed = False
+        for a, residual, top in zip(coeffs, residuals, pivot_max):
+            sum_min = sum(a[j] * (low[j] if a[j] > 0 else high[j]) for j in open_vars)
+            sum_max = sum(a[j] * (high[j] if a[j] > 0 else low[j]) for j in open_vars)
+            if sum_min > residual or sum_max < residual - top:
+                return None, None
+            for j in open_vars:
+                c = a[j]
+                if c > 0:
+                    # c * x_j <= residual - (sum_min without j) and c * x_j >= residual - top - (sum_max without j)
+                    new_high = (residual - sum_min + c * low[j]) // c
+                    new_low = -((sum_max - c * high[j] - residual + top) // c)
+                elif c < 0:
+                    new_low = -((residual - sum_min + c * high[j]) // -c)
+                    new_high = (sum_max - c * low[j] - residual + top) // -c
+                else:
+                    continue
+                if new_low > low[j] or new_high < high[j]:
+                    low[j], high[j] = max(low[j], new_low), min(high[j], new_high)
+                    if low[j] > high[j]:
+                        return None, None
+                    changed = True
+                    break
+            if changed:
+                break
+    return low, high
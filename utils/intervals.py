@@ -0,0 +1,122 @@
+"""Sets of integers stored as sorted, disjoint, inclusive intervals."""
+
+import heapq
+import re
+from bisect import bisect_right
+from typing import Iterable, Iterator
+
+import numpy as np
+
+RANGE_PATTERN = re.compile(r"(\d+)-(\d+)")
+
+
+class IntervalSet:
+    """
+    A set of integers stored as sorted, disjoint, inclusive [start, end] intervals.
+
+    Overlapping and adjacent intervals are merged on construction (which
+    sorts its input, O(n log n)), so membership is a bisect over the
+    interval starts (O(log n)), and union and intersection are linear merges
+    of the two sorted interval lists.
+
+    Args:
+        intervals: (start, end) pairs, inclusive, in any order
+    """
+
+    def __init__(self, intervals: Iterable[tuple[int, int]] = ()):
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        self._extend_sorted(sorted(intervals))
+
+    def _extend_sorted(self, intervals: Iterable[tuple[int, int]]) -> None:
+        """Append intervals given in order of start, merging as it goes (linear)."""
+        for start, end in intervals:
+            if start > end:
+                raise ValueError(f"Interval {start}-{end} ends before it starts")
+            if self.ends and start <= self.ends[-1] + 1:
+                # Overlapping or adjacent: extend the previous interval
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    @classmethod
+    def from_text(cls, text: str) -> "IntervalSet":
+        """
+        Build a set from every "start-end" range in a text (e.g. one per line or comma-separated).
+
+        Args:
+            text: Text containing ranges of non-negative integers
+
+        Returns:
+            The union of the ranges
+        """
+        return cls((int(start), int(end)) for start, end in RANGE_PATTERN.findall(text))
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self.starts, self.ends)
+
+    def __len__(self) -> int:
+        """Number of disjoint intervals (see total_length for the number of integers)."""
+        return len(self.starts)
+
+    def __bool__(self) -> bool:
+        return bool(self.starts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.starts == other.starts and self.ends == other.ends
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+    def __contains__(self, value: int) -> bool:
+        i = bisect_right(self.starts, value) - 1
+        return i >= 0 and value <= self.ends[i]
+
+    def contains_many(self, values: Iterable[int]) -> np.ndarray:
+        """
+        Membership of many values at once, with one vectorized searchsorted.
+
+        Args:
+            values: Integers that fit in int64
+
+        Returns:
+            A bool array, True for the values in the set
+        """
+        values = np.asarray(values, dtype=np.int64)
+        starts = np.asarray(self.starts, dtype=np.int64)
+        ends = np.asarray(self.ends, dtype=np.int64)
+        i = np.searchsorted(starts, values, side="right") - 1
+        return (i >= 0) & (values <= ends[np.maximum(i, 0)]) if len(starts) else np.zeros(values.shape, dtype=bool)
+
+    @property
+    def total_length(self) -> int:
+        """Number of integers in the set."""
+        return sum(end - start + 1 for start, end in self)
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        """Integers in either set."""
+        result = IntervalSet()
+        result._extend_sorted(heapq.merge(self, other))
+        return result
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        """Integers in both sets."""
+        result = []
+        i = j = 0
+        while i < len(self.starts) and j < len(other.starts):
+            start = max(self.starts[i], other.starts[j])
+            end = min(self.ends[i], other.ends[j])
+            if start <= end:
+                result.append((start, end))
+            # Advance whichever interval ends first
+            if self.ends[i] < other.ends[j]:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet(result)
+
+    __or__ = union
+    __and__ = intersection
@@ -0,0 +1,255 @@
+"""Map/reduce over a persistent worker pool, for solutions that parallelise a search."""
+
+import atexit
+import ctypes
+import multiprocessing
+import os
+import pickle
+import sys
+from multiprocessing.pool import Pool
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Best-so-far of the running parallel_max: written only by the parent (as
+# chunk results arrive) and read by workers without a lock. A 64-bit aligned
+# read or write is atomic, so a worker can at worst see a slightly stale value,
+# which only makes its pruning less aggressive, never wrong. Nothing is
+# allocated at import: the shared int64 is created along with the pool (and
+# handed to the workers when they start), a plain int64 serves serial runs.
+_best: Any = None
+
+# Parent-side pool state
+_pool: Optional[Pool] = None
+_pool_best: Any = None
+_pool_workers = 0
+_pool_module = None
+_generation = 0
+_exit_hook_registered = False
+
+# Worker-side state (also used by the parent when running serially)
+_shared_data: Any = None
+_shared_generation = -1
+_local_best: Optional[int] = None
+
+
+def worker_count() -> int:
+    """Number of CPUs this process may use."""
+    return os.process_cpu_count() or 1
+
+
+def shared() -> Any:
+    """The read-only data passed as shared= to the running parallel_map/parallel_max."""
+    return _shared_data
+
+
+def current_best() -> int:
+    """
+    Best value found so far by the running parallel_max, for pruning.
+
+    Combines the global best (results of finished chunks) with the best of the
+    chunk this worker is processing. Never larger than the final result.
+    """
+    best = _best.value if _best is not None else 0
+    if _local_best is not None and _local_best > best:
+        return _local_best
+    return best
+
+
+def _init_worker(best) -> None:
+    global _best
+    _best = best
+
+
+def _load_shared(generation: int, shm_name: Optional[str]) -> None:
+    """Unpickle the shared data of a call once per worker, from the parent's shared memory block."""
+    global _shared_data, _shared_generation
+    if generation == _shared_generation:
+        return
+    if shm_name is None:
+        _shared_data = None
+    else:
+        shm = SharedMemory(name=shm_name, track=False)
+        try:
+            _shared_data = pickle.loads(shm.buf)
+        finally:
+            shm.close()
+    _shared_generation = generation
+
+
+def _map_chunk(task: tuple) -> list:
+    func, generation, shm_name, chunk = task
+    _load_shared(generation, shm_name)
+    return [func(item) for item in chunk]
+
+
+def _max_chunk(task: tuple) -> Optional[int]:
+    global _local_best
+    func, generation, shm_name, chunk = task
+    _load_shared(generation, shm_name)
+    _local_best = None
+    for item in chunk:
+        value = func(item)
+        if _local_best is None or value > _local_best:
+            _local_best = value
+    best, _local_best = _local_best, None
+    return best
+
+
+def _get_pool(workers: int, func: Callable) -> Pool:
+    """Return the persistent pool, (re)starting it when the worker count or the solution module changed."""
+    global _pool, _pool_best, _pool_workers, _pool_module, _exit_hook_registered
+    # Forked workers hold the modules as they were at fork time, so a reloaded
+    # solution (solve --watch) needs fresh workers
+    module = sys.modules.get(func.__module__)
+    if _pool is not None and (_pool_workers != workers or _pool_module is not module):
+        close_pool()
+    if _pool is None:
+        if not _exit_hook_registered:
+            atexit.register(close_pool)
+            _exit_hook_registered = True
+        _pool_best = multiprocessing.RawValue("q", 0)
+        _pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(_pool_best,))
+        _pool_workers = workers
+        _pool_module = module
+    return _pool
+
+
+def close_pool() -> None:
+    """Terminate the persistent worker pool (it is restarted on the next call)."""
+    global _pool, _pool_best
+    if _pool is not None:
+        _pool.terminate()
+        _pool.join()
+        _pool = None
+        _pool_best = None
+
+
+def _use_pool(workers: int, n_items: int) -> bool:
+    # Daemonic processes (e.g. pool workers themselves) may not have children
+    return workers > 1 and n_items > 1 and not multiprocessing.current_process().daemon
+
+
+def _chunks(items: list, workers: int, chunksize: Optional[int]) -> list[list]:
+    if chunksize is None:
+        # Same heuristic as Pool.map: about four chunks per worker
+        chunksize, extra = divmod(len(items), workers * 4)
+        chunksize += bool(extra)
+    return [items[i:i + chunksize] for i in range(0, len(items), chunksize)]
+
+
+def _dispatch(chunk_function: Callable, func: Callable, items: list, shared: Any, workers: int, chunksize: Optional[int], ordered: bool):
+    """Yield chunk results from the pool, with the shared data placed in shared memory for the call."""
+    global _generation
+    _generation += 1
+    shm = None
+    if shared is not None:
+        data = pickle.dumps(shared, protocol=pickle.HIGHEST_PROTOCOL)
+        shm = SharedMemory(create=True, size=max(len(data), 1))
+        shm.buf[:len(data)] = data
+
+    try:
+        pool = _get_pool(workers, func)
+        tasks = [(func, _generation, shm and shm.name, chunk) for chunk in _chunks(items, workers, chunksize)]
+        imap = pool.imap if ordered else pool.imap_unordered
+        yield from imap(chunk_function, tasks)
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+
+def parallel_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    shared: Any = None,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    ordered: bool = True,
+) -> list[R]:
+    """
+    Apply func to every item in parallel on the persistent worker pool.
+
+    Items are sent in chunks; shared is pickled once per call into shared
+    memory and unpickled once per worker, where func reads it via shared().
+    With a single worker everything runs in this process, without any IPC.
+
+    Args:
+        func: Module-level function taking one item
+        items: The items to process
+        shared: Read-only data for func (available through shared())
+        workers: Number of worker processes (default: one per CPU)
+        chunksize: Items per task (default: about four chunks per worker)
+        ordered: Return results in item order (otherwise in completion order)
+
+    Returns:
+        The results of func
+    """
+    global _shared_data
+    items = list(items)
+    workers = workers or worker_count()
+    _shared_data = shared
+    try:
+        if not _use_pool(workers, len(items)):
+            return [func(item) for item in items]
+        return [
+            result
+            for chunk in _dispatch(_map_chunk, func, items, shared, workers, chunksize, ordered)
+            for result in chunk
+        ]
+    finally:
+        _shared_data = None
+
+
+def parallel_max(
+    func: Callable[[T], int],
+    items: Iterable[T],
+    shared: Any = None,
+    initial: int = 0,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> int:
+    """
+    Maximum of func over all items, with a best-so-far that func can prune against.
+
+    func may call current_best() and skip work for items that cannot beat it
+    (returning anything not larger, e.g. 0). The best-so-far lives in a shared
+    int64 that only the parent writes, so checking it costs a memory read
+    instead of a Manager round-trip and a lock.
+
+    Args:
+        func: Module-level function taking one item and returning an int
+        items: The items to search
+        shared: Read-only data for func (available through shared())
+        initial: Starting best value, returned when no item beats it
+        workers: Number of worker processes (default: one per CPU)
+        chunksize: Items per task (default: about four chunks per worker)
+
+    Returns:
+        The largest of initial and the values returned by func
+    """
+    global _shared_data, _best
+    items = list(items)
+    workers = workers or worker_count()
+    previous_best = _best
+    _shared_data = shared
+    try:
+        if not _use_pool(workers, len(items)):
+            _best = ctypes.c_int64(initial)
+            for item in items:
+                value = func(item)
+                if value > _best.value:
+                    _best.value = value
+        else:
+            _get_pool(workers, func)
+            _best = _pool_best
+            _best.value = initial
+            for value in _dispatch(_max_chunk, func, items, shared, workers, chunksize, ordered=False):
+                if value is not None and value > _best.value:
+                    _best.value = value
+        return _best.value
+    finally:
+        _shared_data = None
+        _best = previous_best
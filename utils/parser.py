@@ -2,10 +2,11 @@
 
 import re
 import typer
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from pathlib import Path
 
 from utils.display import console
+from utils.paths import iter_solution_paths
 
 
 def parse_puzzle(puzzle: str, require_part: bool = True) -> Tuple[int, int, Optional[str]]:
@@ -74,3 +75,59 @@ def parse_puzzle(puzzle: str, require_part: bool = True) -> Tuple[int, int, Opti
         raise typer.Exit(code=1)
 
     return year, day, part
+
+
+def parse_puzzle_selection(selection: str) -> List[Tuple[int, int, str]]:
+    """
+    Parse a selection of puzzle parts with day ranges and globs.
+
+    Formats supported (comma-separate several selections):
+        2025/3      -> day 3, both parts
+        2025/3a     -> day 3, part a
+        2025/1-11   -> days 1 to 11, both parts
+        2025/1-11b  -> days 1 to 11, part b
+        2025/*      -> every solved day of 2025
+        2025/*a     -> part a of every solved day of 2025
+
+    Only days with an existing solution file are selected.
+
+    Args:
+        selection: Selection string
+
+    Returns:
+        Sorted list of unique (year, day, part) tuples
+
+    Raises:
+        typer.Exit if the format is invalid or nothing matches
+    """
+    pattern = r'^(\d{4})/(?:(\*)|(\d{1,2})(?:-(\d{1,2}))?)([ab])?$'
+    selected = set()
+
+    for item in selection.split(','):
+        item = item.strip()
+        match = re.match(pattern, item)
+        if not match:
+            console.print(f"[red]Error: Invalid puzzle selection '{item}'[/red]")
+            console.print("[yellow]Expected format: YYYY/DD[a|b], YYYY/D-D[a|b] or YYYY/*[a|b] (e.g., 2025/1-11, 2025/*b)[/yellow]")
+            raise typer.Exit(code=1)
+
+        year = int(match.group(1))
+        if match.group(2):
+            first, last = 1, 25
+        else:
+            first = int(match.group(3))
+            last = int(match.group(4)) if match.group(4) else first
+            if not 1 <= first <= last <= 25:
+                console.print(f"[red]Error: Invalid day range in '{item}' (days must be 1-25, ascending)[/red]")
+                raise typer.Exit(code=1)
+        parts = match.group(5) or "ab"
+
+        for solution_year, day, _ in iter_solution_paths(year):
+            if first <= day <= last:
+                selected.update((solution_year, day, part) for part in parts)
+
+    if not selected:
+        console.print(f"[red]Error: No solution files match '{selection}'[/red]")
+        raise typer.Exit(code=1)
+
+    return sorted(selected)
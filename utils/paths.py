@@ -1,6 +1,7 @@
 """Path and file utilities."""
 
 from pathlib import Path
+from typing import Iterator, Tuple
 
 
 def get_solution_path(year: int, day: int) -> Path:
@@ -17,6 +18,18 @@ def get_solution_path(year: int, day: int) -> Path:
     return Path(__file__).parent.parent / "solutions" / str(year) / f"{day:02d}.py"
 
 
+def get_data_dir() -> Path:
+    """
+    Get the project-local directory for generated data (benchmark history, caches).
+
+    Returns:
+        Path to the .aoc directory in the project root (created if missing)
+    """
+    data_dir = Path(__file__).parent.parent / ".aoc"
+    data_dir.mkdir(exist_ok=True)
+    return data_dir
+
+
 def ensure_solution_directory(year: int) -> Path:
     """
     Ensure the solution directory exists and has an __init__.py file.
@@ -36,3 +49,23 @@ def ensure_solution_directory(year: int) -> Path:
         init_file.write_text("")
 
     return solutions_dir
+
+
+def iter_solution_paths(year: int | None = None) -> Iterator[Tuple[int, int, Path]]:
+    """
+    Find all solution files, in year/day order.
+
+    Args:
+        year: Only include solutions of this year (all years if None)
+
+    Yields:
+        Tuples of (year, day, path) for every solutions/YYYY/DD.py file
+    """
+    solutions_root = Path(__file__).parent.parent / "solutions"
+    for year_dir in sorted(solutions_root.iterdir()):
+        if not (year_dir.is_dir() and year_dir.name.isdigit() and len(year_dir.name) == 4):
+            continue
+        if year is not None and int(year_dir.name) != year:
+            continue
+        for solution_file in sorted(year_dir.glob("[0-9][0-9].py")):
+            yield int(year_dir.name), int(solution_file.stem), solution_file
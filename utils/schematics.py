@@ -0,0 +1,59 @@
+"""Parser for machine schematic lines like "[.##.] (3) (1,3) (2) {3,5,4,7}" (2025 day 10)."""
+
+import re
+from dataclasses import dataclass
+
+LINE_PATTERN = re.compile(r"\[([.#]*)\]((?:\s+\(\d+(?:,\d+)*\))*)\s+\{(\d+(?:,\d+)*)\}\s*")
+BUTTON_PATTERN = re.compile(r"\(([\d,]+)\)")
+_BITS = str.maketrans(".#", "01")
+
+
+@dataclass(frozen=True)
+class Schematic:
+    """
+    One machine: indicator lights, buttons and joltage requirements.
+
+    Attributes:
+        lights: Bitmask of the lights that must be on (bit i is light i)
+        size: Number of indicator lights
+        buttons: Per button, the indices of the lights/counters it affects
+        button_masks: The same buttons as bitmasks
+        joltages: Required value per counter
+    """
+
+    lights: int
+    size: int
+    buttons: tuple[tuple[int, ...], ...]
+    button_masks: tuple[int, ...]
+    joltages: tuple[int, ...]
+
+
+def parse_schematic(line: str) -> Schematic:
+    """
+    Parse one schematic line with a compiled regex, without eval.
+
+    Args:
+        line: A line like "[.##.] (3) (1,3) (2) {3,5,4,7}"
+
+    Returns:
+        The parsed schematic
+
+    Raises:
+        ValueError: If the line is not in the schematic format
+    """
+    match = LINE_PATTERN.fullmatch(line)
+    if match is None:
+        raise ValueError(f"Not a machine schematic: {line!r}")
+    indicators, buttons_text, joltages_text = match.groups()
+
+    # Reversed so that light i ends up in bit i
+    lights = int(indicators[::-1].translate(_BITS), 2) if indicators else 0
+    buttons = tuple(tuple(map(int, group.split(","))) for group in BUTTON_PATTERN.findall(buttons_text))
+    button_masks = tuple(sum({1 << i for i in button}) for button in buttons)
+    joltages = tuple(map(int, joltages_text.split(",")))
+    return Schematic(lights, len(indicators), buttons, button_masks, joltages)
+
+
+def parse_schematics(text: str) -> list[Schematic]:
+    """Parse every non-empty line of a puzzle input."""
+    return [parse_schematic(line) for line in text.splitlines() if line.strip()]
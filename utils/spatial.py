@@ -0,0 +1,97 @@
+"""Closest point pairs without materializing the full pairwise distance table."""
+
+from typing import Iterator, Optional, Sequence
+
+import numpy as np
+
+# Elements of the (rows, points, dimensions) difference block computed at once
+BLOCK_ELEMENTS = 1 << 18
+
+
+def _smallest_pairs(
+    coords: np.ndarray,
+    size: int,
+    after: Optional[tuple[int, int]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The size smallest pairs ordered by (squared distance, pair index) that come after a given one.
+
+    Pairs (i, j) with i < j are identified by the pair index i * n + j. Rows
+    of the distance table are computed in blocks, and each block only keeps
+    the candidates that can still make the cut, so memory stays at one
+    block plus about size candidates.
+
+    Returns:
+        Squared distances and pair indices of the selected pairs, in order
+    """
+    n, dims = coords.shape
+    block_rows = max(1, BLOCK_ELEMENTS // (n * dims))
+    columns = np.arange(n)
+    best_d = np.empty(0, dtype=np.int64)
+    best_idx = np.empty(0, dtype=np.int64)
+
+    for start in range(0, n - 1, block_rows):
+        rows = np.arange(start, min(start + block_rows, n - 1))
+        diff = coords[rows, None, :] - coords[None, :, :]
+        d2 = np.einsum("ijk,ijk->ij", diff, diff)
+        idx = rows[:, None] * n + columns[None, :]
+
+        valid = columns[None, :] > rows[:, None]
+        if after is not None:
+            after_d, after_idx = after
+            valid &= (d2 > after_d) | ((d2 == after_d) & (idx > after_idx))
+
+        best_d = np.concatenate([best_d, d2[valid]])
+        best_idx = np.concatenate([best_idx, idx[valid]])
+        if len(best_d) > size:
+            # Keep everything up to the size-th smallest distance (ties included)
+            kth = np.partition(best_d, size - 1)[size - 1]
+            keep = best_d <= kth
+            best_d, best_idx = best_d[keep], best_idx[keep]
+
+    order = np.lexsort((best_idx, best_d))[:size]
+    return best_d[order], best_idx[order]
+
+
+def nearest_pairs(
+    points: Sequence[Sequence[int]],
+    k: Optional[int] = None,
+    batch: Optional[int] = None,
+) -> Iterator[tuple[int, int]]:
+    """
+    Yield index pairs of points in order of increasing Euclidean distance.
+
+    Squared distances are computed exactly in int64 with NumPy. Pairs are
+    produced in batches: every batch is a blocked scan over all pairs that
+    keeps only the next batch-size smallest, so memory stays bounded by one
+    block and one batch instead of n²/2 pairs. Batches double in size, so a
+    consumer that stops early (e.g. Kruskal) pays for few scans. Equal
+    distances are ordered by (i, j).
+
+    Args:
+        points: Integer coordinates, all of the same dimension
+        k: Stop after this many pairs (None for all pairs)
+        batch: Size of the first batch (default: 4 per point, at least 1024)
+
+    Yields:
+        (i, j) with i < j, indices into points
+    """
+    coords = np.asarray(points, dtype=np.int64)
+    n = len(coords)
+    if n < 2:
+        return
+    if coords.ndim != 2:
+        coords = coords.reshape(n, -1)
+    total = n * (n - 1) // 2
+    limit = total if k is None else min(k, total)
+    batch = batch or max(4 * n, 1024)
+
+    after = None
+    produced = 0
+    while produced < limit:
+        d2, idx = _smallest_pairs(coords, min(batch, limit - produced), after)
+        for pair in idx.tolist():
+            yield divmod(pair, n)
+        produced += len(idx)
+        after = (int(d2[-1]), int(idx[-1]))
+        batch *= 2
@@ -0,0 +1,62 @@
+"""Disjoint-set (union-find) structure for connectivity puzzles."""
+
+
+class UnionFind:
+    """
+    Disjoint sets over the elements 0..n-1.
+
+    Array-backed (plain lists of ints), with union by size and path
+    compression, so a sequence of unions and finds runs in near-linear time.
+
+    Args:
+        n: Number of elements, each initially in its own set
+    """
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.size = [1] * n
+        self.components = n
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def find(self, x: int) -> int:
+        """Representative (root) of the set containing x."""
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        # Path compression: point everything on the way directly at the root
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a: int, b: int) -> bool:
+        """
+        Merge the sets containing a and b.
+
+        Returns:
+            True if they were in different sets, False if already connected
+        """
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        # Union by size: hang the smaller tree under the larger one
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        self.components -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        """Whether a and b are in the same set."""
+        return self.find(a) == self.find(b)
+
+    def component_size(self, x: int) -> int:
+        """Number of elements in the set containing x."""
+        return self.size[self.find(x)]
+
+    def component_sizes(self) -> list[int]:
+        """Sizes of all sets, largest first."""
+        return sorted((self.size[x] for x, p in enumerate(self.parent) if x == p), reverse=True)